@@ -5,6 +5,7 @@ Provides thread-safe connection pooling with retry logic for the unified feed ap
 
 import atexit
 import signal
+import threading
 import time
 from contextlib import contextmanager
 from functools import wraps
@@ -22,6 +23,22 @@ _pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
 # Legacy singleton connection (kept for backward compatibility)
 _connection: Optional[Connection] = None
 
+# Session settings applied to every pooled connection at connect time.
+# jit=off: JIT compilation only pays off for long analytic queries; for the
+# short OLTP statements issued here it is pure planning overhead.
+_SESSION_OPTIONS = "-c jit=off"
+
+# Lets the current transaction's commit return before its WAL flush reaches
+# disk. A server crash can lose the last few hundred ms of such commits but
+# never corrupts data. Only bulk feed/email writes use it - rows that are
+# re-derived from Gmail and the parsers on the next refresh - never user,
+# auth or OAuth token writes.
+ASYNC_COMMIT_SQL = "SET LOCAL synchronous_commit = off"
+
+# Per-thread handle on the connection of the active transaction() block, so
+# Repository calls inside it share that connection and its transaction.
+_local = threading.local()
+
 
 def retry_on_pool_exhaustion(max_retries: int = 3, backoff_base: float = 1.0) -> Callable:
     """Decorator for retrying on connection pool exhaustion.
@@ -81,7 +98,8 @@ def initialize_pool(minconn: int = 2, maxconn: int = 10) -> None:
     _pool = psycopg2.pool.ThreadedConnectionPool(
         minconn=minconn,
         maxconn=maxconn,
-        dsn=database_url
+        dsn=database_url,
+        options=_SESSION_OPTIONS,
     )
 
     # Register cleanup handlers for application shutdown
@@ -122,6 +140,10 @@ def get_connection() -> Generator[Connection, None, None]:
     Automatically returns connection to pool after use.
     Retries on pool exhaustion with exponential backoff (1s, 2s, 4s).
 
+    Inside a transaction() block this yields the transaction's connection.
+    Elsewhere every block checks out its own connection, so nested blocks
+    never commit or poison each other's uncommitted work.
+
     Yields:
         Connection: PostgreSQL connection object
 
@@ -134,7 +156,12 @@ def get_connection() -> Generator[Connection, None, None]:
         ...     with conn.cursor() as cur:
         ...         cur.execute("SELECT 1")
     """
-    conn = None
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        # Inside transaction() on this thread - join it
+        yield conn
+        return
+
     try:
         # Use retry-enabled helper to get connection
         conn = _get_connection_from_pool()
@@ -146,6 +173,95 @@ def get_connection() -> Generator[Connection, None, None]:
             _pool.putconn(conn)
 
 
+@contextmanager
+def transaction(durable: bool = True) -> Generator[Connection, None, None]:
+    """Run several Repository writes in a single database transaction.
+
+    Repository methods called inside the block share its connection (see
+    get_connection) and skip their own per-call commit, so a loop over N
+    items costs one commit instead of N. Commits when the block exits normally
+    and rolls back if it raises. Nested transaction() blocks join the outer one
+    and keep its durability.
+
+    Args:
+        durable: If False, commit without waiting for the WAL flush (see
+            ASYNC_COMMIT_SQL). Only for bulk data that can be re-derived.
+
+    Yields:
+        Connection: PostgreSQL connection object
+
+    Example:
+        >>> with transaction():
+        ...     for email in emails:
+        ...         repo.track_email_processed(...)
+    """
+    if getattr(_local, "conn", None) is not None:
+        yield _local.conn
+        return
+
+    with get_connection() as conn:
+        _local.conn = conn
+        try:
+            if not durable:
+                with conn.cursor() as cursor:
+                    cursor.execute(ASYNC_COMMIT_SQL)
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            _local.conn = None
+
+
+@contextmanager
+def savepoint() -> Generator[None, None, None]:
+    """Undo only this block's writes if it raises inside transaction().
+
+    One failed statement aborts the whole PostgreSQL transaction, so a batch
+    loop that logs and skips bad items must wrap each item in a savepoint;
+    otherwise every later write fails and the final commit silently rolls
+    back the whole batch. Outside transaction() this does nothing, since
+    each Repository call commits on its own.
+
+    Example:
+        >>> with transaction():
+        ...     for email in emails:
+        ...         try:
+        ...             with savepoint():
+        ...                 repo.track_email_processed(...)
+        ...         except Exception:
+        ...             continue
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        yield
+        return
+
+    with conn.cursor() as cursor:
+        cursor.execute("SAVEPOINT batch_item")
+    try:
+        yield
+    except BaseException:
+        with conn.cursor() as cursor:
+            cursor.execute("ROLLBACK TO SAVEPOINT batch_item")
+        raise
+    else:
+        with conn.cursor() as cursor:
+            cursor.execute("RELEASE SAVEPOINT batch_item")
+
+
+def commit(conn: Connection) -> None:
+    """Commit conn unless an enclosing transaction() will commit it.
+
+    Args:
+        conn: Connection obtained from get_connection()
+    """
+    if getattr(_local, "conn", None) is None:
+        conn.commit()
+
+
 def closeall_connections() -> None:
     """Close all connections in the pool.
 
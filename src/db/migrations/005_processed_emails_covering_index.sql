@@ -0,0 +1,7 @@
+-- Migration 005: Covering index for processed-email lookups
+-- Created: 2026-10-16
+-- Purpose: Answer get_processed_message_ids (message_id by sender_email) from the index alone
+
+-- (sender_email, message_id) lets the sender filter return message_id via an
+-- index-only scan instead of visiting the heap for every matching row.
+CREATE INDEX IF NOT EXISTS idx_processed_emails_sender_msgid ON processed_emails(sender_email, message_id);
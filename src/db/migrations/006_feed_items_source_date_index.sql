@@ -0,0 +1,8 @@
+-- Migration 006: Composite index for per-source feed queries
+-- Created: 2026-10-16
+-- Purpose: Serve source-filtered feed pages, searches and counts from one index
+
+-- Feed queries filter on source_type and filter/order on item_date; with
+-- (source_type, item_date DESC) a filtered page is an index range scan
+-- instead of a sort over every row of the source.
+CREATE INDEX IF NOT EXISTS idx_feed_items_source_date ON feed_items(source_type, item_date DESC);
@@ -7,11 +7,70 @@ import json
 from datetime import datetime, timezone
 from typing import Optional
 
-from src.db.connection import get_connection
+from psycopg2.extras import execute_values
+
+from src.db.connection import commit, get_connection
 from src.models.feed_item import FeedItem
 from src.models.newsletter_models import NewsletterConfigValues, SenderRecord
 from src.models.source import SourceConfig
 
+# Upsert shared by save_feed_item and save_feed_items. The batch path expands
+# the single VALUES %s placeholder into a multi-row VALUES list.
+# Re-saving an unchanged item (every Zotero refresh, re-parsed newsletters) is a
+# no-op: the WHERE clause skips the update, so no new row version, index
+# entries or WAL are written and fetched_at keeps the last content change.
+_UPSERT_FEED_ITEMS_SQL = """
+    INSERT INTO feed_items
+        (id, source_type, source_id, title, item_date, summary, link, metadata, fetched_at)
+    VALUES %s
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title,
+        summary = EXCLUDED.summary,
+        link = EXCLUDED.link,
+        metadata = EXCLUDED.metadata,
+        fetched_at = EXCLUDED.fetched_at
+    WHERE (feed_items.title, feed_items.summary, feed_items.link, feed_items.metadata)
+        IS DISTINCT FROM (EXCLUDED.title, EXCLUDED.summary, EXCLUDED.link, EXCLUDED.metadata)
+"""
+_FEED_ITEM_VALUES = "(%s, %s, %s, %s, %s, %s, %s, %s, %s)"
+_UPSERT_FEED_ITEM_SQL = _UPSERT_FEED_ITEMS_SQL % _FEED_ITEM_VALUES
+
+# Batches at least this large refresh feed_items planner statistics straight
+# away instead of waiting for autovacuum's analyze threshold
+_ANALYZE_AFTER_ROWS = 1000
+
+
+def _feed_item_params(item: FeedItem) -> tuple:
+    """Return the _UPSERT_FEED_ITEMS_SQL parameters for one FeedItem."""
+    return (
+        item.id,
+        item.source_type,
+        item.source_id,
+        item.title,
+        item.date,
+        item.summary,
+        item.link,
+        json.dumps(item.metadata),
+        item.fetched_at,
+    )
+
+
+def _row_to_feed_item(row: tuple) -> FeedItem:
+    """Build a FeedItem from a row in the column order the feed queries select."""
+    (item_id, source_type, source_id, title, item_date,
+     summary, link, metadata, fetched_at) = row
+    return FeedItem(
+        id=item_id,
+        source_type=source_type,
+        source_id=source_id,
+        title=title,
+        date=item_date,
+        summary=summary,
+        link=link,
+        metadata=metadata if isinstance(metadata, dict) else json.loads(metadata or "{}"),
+        fetched_at=fetched_at,
+    )
+
 
 class Repository:
     """Database repository for feed items and source configurations."""
@@ -27,30 +86,10 @@ class Repository:
         with get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
-                    """
-                    INSERT INTO feed_items
-                        (id, source_type, source_id, title, item_date, summary, link, metadata, fetched_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (id) DO UPDATE SET
-                        title = EXCLUDED.title,
-                        summary = EXCLUDED.summary,
-                        link = EXCLUDED.link,
-                        metadata = EXCLUDED.metadata,
-                        fetched_at = EXCLUDED.fetched_at
-                    """,
-                    (
-                        item.id,
-                        item.source_type,
-                        item.source_id,
-                        item.title,
-                        item.date,
-                        item.summary,
-                        item.link,
-                        json.dumps(item.metadata),
-                        item.fetched_at,
-                    ),
+                    _UPSERT_FEED_ITEM_SQL,
+                    _feed_item_params(item),
                 )
-            conn.commit()
+            commit(conn)
 
     def save_feed_items(self, items: list[FeedItem]) -> None:
         """Save multiple feed items in a batch.
@@ -61,34 +100,24 @@ class Repository:
         if not items:
             return
 
+        # One row per id: a multi-row upsert may not touch the same row twice.
+        # Later items win, as they did with one statement per item.
+        rows = list({item.id: _feed_item_params(item) for item in items}.values())
+
         with get_connection() as conn:
             with conn.cursor() as cursor:
-                for item in items:
-                    cursor.execute(
-                        """
-                        INSERT INTO feed_items
-                            (id, source_type, source_id, title, item_date, summary, link, metadata, fetched_at)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (id) DO UPDATE SET
-                            title = EXCLUDED.title,
-                            summary = EXCLUDED.summary,
-                            link = EXCLUDED.link,
-                            metadata = EXCLUDED.metadata,
-                            fetched_at = EXCLUDED.fetched_at
-                        """,
-                        (
-                            item.id,
-                            item.source_type,
-                            item.source_id,
-                            item.title,
-                            item.date,
-                            item.summary,
-                            item.link,
-                            json.dumps(item.metadata),
-                            item.fetched_at,
-                        ),
-                    )
-            conn.commit()
+                # Pages of multi-row INSERTs: the server parses and plans one
+                # statement per page rather than one per item
+                execute_values(
+                    cursor,
+                    _UPSERT_FEED_ITEMS_SQL,
+                    rows,
+                    template=_FEED_ITEM_VALUES,
+                    page_size=500,
+                )
+                if len(rows) >= _ANALYZE_AFTER_ROWS:
+                    cursor.execute("ANALYZE feed_items")
+            commit(conn)
 
     def get_feed_items(
         self,
@@ -96,6 +125,8 @@ class Repository:
         limit: int = 50,
         offset: int = 0,
         days: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
     ) -> list[FeedItem]:
         """Retrieve feed items from the database.
 
@@ -104,6 +135,8 @@ class Repository:
             limit: Maximum items to return
             offset: Number of items to skip
             days: Filter to items from last N days (optional)
+            start_date: Filter to items on or after this datetime (optional)
+            end_date: Filter to items on or before this datetime (optional)
 
         Returns:
             List of FeedItem objects sorted by date descending
@@ -126,26 +159,125 @@ class Repository:
                     query += " AND item_date >= NOW() - (%s * INTERVAL '1 day')"
                     params.append(days)
 
+                if start_date:
+                    query += " AND item_date >= %s"
+                    params.append(start_date)
+
+                if end_date:
+                    query += " AND item_date <= %s"
+                    params.append(end_date)
+
                 query += " ORDER BY item_date DESC LIMIT %s OFFSET %s"
                 params.extend([limit, offset])
 
                 cursor.execute(query, params)
-                rows = cursor.fetchall()
+                # Convert rows as they come off the cursor; no interim list
+                return [_row_to_feed_item(row) for row in cursor]
 
-            return [
-                FeedItem(
-                    id=row[0],
-                    source_type=row[1],
-                    source_id=row[2],
-                    title=row[3],
-                    date=row[4],
-                    summary=row[5],
-                    link=row[6],
-                    metadata=row[7] if isinstance(row[7], dict) else json.loads(row[7] or "{}"),
-                    fetched_at=row[8],
-                )
-                for row in rows
-            ]
+    def search_feed_items(
+        self,
+        query: str,
+        source_type: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[FeedItem]:
+        """Find feed items whose title or summary contains query.
+
+        Matching is a case-insensitive substring match (ILIKE), with LIKE
+        wildcards in query matched literally.
+
+        Args:
+            query: Text to search for
+            source_type: Filter by source type (optional)
+            limit: Maximum items to return
+            offset: Number of items to skip
+
+        Returns:
+            List of matching FeedItem objects sorted by date descending
+        """
+        escaped = (
+            query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        pattern = f"%{escaped}%"
+
+        with get_connection() as conn:
+            with conn.cursor() as cursor:
+                sql = """
+                    SELECT id, source_type, source_id, title, item_date,
+                           summary, link, metadata, fetched_at
+                    FROM feed_items
+                    WHERE (title ILIKE %s OR summary ILIKE %s)
+                """
+                params: list = [pattern, pattern]
+
+                if source_type:
+                    sql += " AND source_type = %s"
+                    params.append(source_type)
+
+                sql += " ORDER BY item_date DESC LIMIT %s OFFSET %s"
+                params.extend([limit, offset])
+
+                cursor.execute(sql, params)
+                return [_row_to_feed_item(row) for row in cursor]
+
+    def count_feed_items(
+        self,
+        source_type: Optional[str] = None,
+        days: Optional[int] = None,
+    ) -> int:
+        """Count feed items without fetching them.
+
+        Args:
+            source_type: Filter by source type (optional)
+            days: Filter to items from last N days (optional)
+
+        Returns:
+            Number of matching items
+        """
+        with get_connection() as conn:
+            with conn.cursor() as cursor:
+                query = "SELECT COUNT(*) FROM feed_items WHERE 1=1"
+                params: list = []
+
+                if source_type:
+                    query += " AND source_type = %s"
+                    params.append(source_type)
+
+                if days:
+                    query += " AND item_date >= NOW() - (%s * INTERVAL '1 day')"
+                    params.append(days)
+
+                cursor.execute(query, params)
+                return cursor.fetchone()[0]
+
+    def get_feed_item_ids(
+        self,
+        source_type: Optional[str] = None,
+        limit: int = 1000,
+    ) -> list[str]:
+        """Retrieve feed item IDs only, without the rest of each row.
+
+        Args:
+            source_type: Filter by source type (optional)
+            limit: Maximum IDs to return
+
+        Returns:
+            List of feed item IDs, newest item first
+        """
+        with get_connection() as conn:
+            with conn.cursor() as cursor:
+                query = "SELECT id FROM feed_items WHERE 1=1"
+                params: list = []
+
+                if source_type:
+                    query += " AND source_type = %s"
+                    params.append(source_type)
+
+                query += " ORDER BY item_date DESC LIMIT %s"
+                params.append(limit)
+
+                cursor.execute(query, params)
+                return [row[0] for row in cursor]
 
     def get_feed_items_since(
         self,
@@ -187,11 +319,11 @@ class Repository:
 
                 logger.info(f"get_feed_items_since query: since={since}, source_type={source_type}, limit={limit}")
                 cursor.execute(query, params)
-                rows = cursor.fetchall()
-                logger.info(f"get_feed_items_since returned {len(rows)} rows")
+                items = [_row_to_feed_item(row) for row in cursor]
+                logger.info(f"get_feed_items_since returned {len(items)} rows")
 
                 # Also log what items exist for debugging
-                if len(rows) == 0 and source_type:
+                if not items and source_type:
                     cursor.execute(
                         "SELECT COUNT(*), MIN(item_date), MAX(item_date) FROM feed_items WHERE source_type = %s",
                         (source_type,)
@@ -201,20 +333,7 @@ class Repository:
                         count, min_date, max_date = debug_row
                         logger.info(f"Debug: {source_type} has {count} total items, date range: {min_date} to {max_date}")
 
-            return [
-                FeedItem(
-                    id=row[0],
-                    source_type=row[1],
-                    source_id=row[2],
-                    title=row[3],
-                    date=row[4],
-                    summary=row[5],
-                    link=row[6],
-                    metadata=row[7] if isinstance(row[7], dict) else json.loads(row[7] or "{}"),
-                    fetched_at=row[8],
-                )
-                for row in rows
-            ]
+            return items
 
     def delete_feed_item(self, item_id: str) -> None:
         """Delete a feed item by ID.
@@ -225,7 +344,28 @@ class Repository:
         with get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute("DELETE FROM feed_items WHERE id = %s", (item_id,))
-            conn.commit()
+            commit(conn)
+
+    def delete_feed_items(self, item_ids: list[str]) -> int:
+        """Delete several feed items by ID in one statement.
+
+        Args:
+            item_ids: The feed item IDs to delete
+
+        Returns:
+            Number of deleted items
+        """
+        if not item_ids:
+            return 0
+
+        with get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "DELETE FROM feed_items WHERE id = ANY(%s)", (list(item_ids),)
+                )
+                deleted = cursor.rowcount
+            commit(conn)
+            return deleted
 
     def delete_old_feed_items(self, source_type: str, keep_count: int = 100) -> int:
         """Delete old feed items, keeping only the most recent.
@@ -239,21 +379,22 @@ class Repository:
         """
         with get_connection() as conn:
             with conn.cursor() as cursor:
+                # Select the rows past the keep window directly (one ordered
+                # scan) rather than anti-joining against the rows to keep
                 cursor.execute(
                     """
                     DELETE FROM feed_items
-                    WHERE source_type = %s
-                    AND id NOT IN (
+                    WHERE id IN (
                         SELECT id FROM feed_items
                         WHERE source_type = %s
                         ORDER BY item_date DESC
-                        LIMIT %s
+                        OFFSET %s
                     )
                     """,
-                    (source_type, source_type, keep_count),
+                    (source_type, keep_count),
                 )
                 deleted = cursor.rowcount
-            conn.commit()
+            commit(conn)
             return deleted
 
     def save_source_config(self, config: SourceConfig) -> None:
@@ -285,7 +426,7 @@ class Repository:
                         datetime.now(timezone.utc),
                     ),
                 )
-            conn.commit()
+            commit(conn)
 
     def get_source_config(self, source_type: str) -> Optional[SourceConfig]:
         """Retrieve source configuration by type.
@@ -386,7 +527,7 @@ class Repository:
                         datetime.now(timezone.utc),
                     ),
                 )
-            conn.commit()
+            commit(conn)
 
     def get_oauth_token(
         self, provider: str
@@ -434,7 +575,7 @@ class Repository:
                     "DELETE FROM oauth_tokens WHERE provider = %s",
                     (provider,),
                 )
-            conn.commit()
+            commit(conn)
 
     def save_feed_items_batch(self, items: list[FeedItem]) -> None:
         """Save multiple feed items in a batch (alias for save_feed_items).
@@ -466,31 +607,39 @@ class Repository:
                 return cursor.fetchone() is not None
 
     def get_processed_message_ids(
-        self, sender_emails: Optional[list[str]] = None
+        self,
+        sender_emails: Optional[list[str]] = None,
+        status: Optional[str] = None,
     ) -> set[str]:
         """Get set of processed message IDs.
 
         Args:
             sender_emails: Optional filter by sender emails
+            status: Optional filter by processing status (e.g. 'parsed')
 
         Returns:
             Set of message IDs that have been processed
         """
+        conditions = []
+        params: list = []
+        if sender_emails:
+            conditions.append("sender_email = ANY(%s)")
+            params.append(sender_emails)
+        if status:
+            conditions.append("status = %s")
+            params.append(status)
+
+        query = "SELECT message_id FROM processed_emails"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
         with get_connection() as conn:
             with conn.cursor() as cursor:
-                if sender_emails:
-                    cursor.execute(
-                        """
-                        SELECT message_id FROM processed_emails
-                        WHERE sender_email = ANY(%s)
-                        """,
-                        (sender_emails,)
-                    )
-                else:
-                    cursor.execute("SELECT message_id FROM processed_emails")
+                cursor.execute(query, tuple(params))
 
-                rows = cursor.fetchall()
-                return {row[0] for row in rows}
+                # Iterate the cursor so rows go straight into the set without
+                # an intermediate list of tuples
+                return {row[0] for row in cursor}
 
     def track_email_processed(
         self,
@@ -523,7 +672,7 @@ class Repository:
                     """,
                     (message_id, sender_email, subject, status, error_message)
                 )
-            conn.commit()
+            commit(conn)
 
     def update_email_status(
         self,
@@ -555,7 +704,7 @@ class Repository:
                 )
                 if cursor.rowcount == 0:
                     raise ValueError(f"Email with message_id '{message_id}' not found")
-            conn.commit()
+            commit(conn)
 
     # =========================================================================
     # Sender CRUD Methods
@@ -630,7 +779,7 @@ class Repository:
                             sender.enabled,
                         ),
                     )
-            conn.commit()
+            commit(conn)
 
     def update_sender(self, sender: SenderRecord) -> None:
         """Update all mutable fields of an existing sender."""
@@ -644,7 +793,7 @@ class Repository:
                     """,
                     (sender.display_name, sender.parsing_prompt, sender.enabled, sender.email),
                 )
-            conn.commit()
+            commit(conn)
 
     def update_sender_display_name(self, email: str, display_name: Optional[str]) -> None:
         """Update only the display_name field of a sender."""
@@ -654,14 +803,14 @@ class Repository:
                     "UPDATE senders SET display_name = %s WHERE email = %s",
                     (display_name, email),
                 )
-            conn.commit()
+            commit(conn)
 
     def delete_sender(self, email: str) -> None:
         """Delete a sender row by email."""
         with get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute("DELETE FROM senders WHERE email = %s", (email,))
-            conn.commit()
+            commit(conn)
 
     def sender_exists(self, email: str) -> bool:
         """Return True if a sender with this email exists."""
@@ -716,7 +865,7 @@ class Repository:
                     """,
                     (key, value),
                 )
-            conn.commit()
+            commit(conn)
 
     def set_config_values(self, values: dict[str, str]) -> None:
         """Upsert multiple config key/value pairs in a single transaction."""
@@ -731,7 +880,7 @@ class Repository:
                         """,
                         (key, value),
                     )
-            conn.commit()
+            commit(conn)
 
     def config_key_exists(self, key: str) -> bool:
         """Return True if a config key exists in newsletter_config."""
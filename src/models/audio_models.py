@@ -79,6 +79,10 @@ class AudioSegment(BaseModel):
     duration_estimate: float = Field(
         default=0.0, ge=0.0, description="Estimated duration in seconds (if available)"
     )
+    source_path: Optional[Path] = Field(
+        default=None,
+        description="File already holding audio_bytes (e.g. audio cache entry), if any",
+    )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -95,6 +99,11 @@ class ElevenLabsConfig(BaseModel):
         default="EXAVITQu4vr4xnSDxMaL",
         description="ElevenLabs voice ID for female voice",
     )
+    max_concurrency: int = Field(
+        default=3,
+        ge=1,
+        description="Concurrent API requests allowed by the ElevenLabs plan",
+    )
 
     @classmethod
     def from_env(cls) -> "ElevenLabsConfig":
@@ -118,6 +127,12 @@ class ElevenLabsConfig(BaseModel):
                 "ELEVENLABS_FEMALE_VOICE_ID",
                 cls.model_fields["female_voice_id"].default,
             ),
+            max_concurrency=int(
+                os.getenv(
+                    "ELEVENLABS_MAX_CONCURRENCY",
+                    cls.model_fields["max_concurrency"].default,
+                )
+            ),
         )
 
 
@@ -6,6 +6,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
+from src.db.connection import savepoint, transaction
 from src.db.repository import Repository
 from src.newsletter.gmail_client import authenticate_gmail, collect_emails
 from src.newsletter.markdown_converter import convert_to_markdown
@@ -121,26 +122,29 @@ def collect_newsletter_emails(
         result["errors"].append(f"Failed to collect emails: {str(e)}")
         return result
 
-    # Save emails and track in database
+    # Save emails and track in database (one commit for the whole batch)
     emails_collected = 0
-    for email in emails:
-        try:
-            # Save email to file
-            save_email(email, data_dir)
-
-            # Track in database
-            repo.track_email_processed(
-                email["message_id"],
-                email["sender"],
-                "collected",
-                subject=email.get("subject"),
-            )
+    with transaction(durable=False):
+        for email in emails:
+            try:
+                # A failure rolls back this email's row only, not the batch
+                with savepoint():
+                    # Save email to file
+                    save_email(email, data_dir)
+
+                    # Track in database
+                    repo.track_email_processed(
+                        email["message_id"],
+                        email["sender"],
+                        "collected",
+                        subject=email.get("subject"),
+                    )
 
-            emails_collected += 1
-        except Exception as e:
-            result["errors"].append(
-                f"Failed to save email {email.get('message_id', 'unknown')}: {str(e)}"
-            )
+                emails_collected += 1
+            except Exception as e:
+                result["errors"].append(
+                    f"Failed to save email {email.get('message_id', 'unknown')}: {str(e)}"
+                )
 
     result["success"] = True
     result["emails_collected"] = emails_collected
@@ -196,36 +200,43 @@ def convert_emails_to_markdown(
     emails_converted = 0
     repo = Repository()
 
-    for email_file in email_files:
-        message_id = email_file.stem
+    # One directory listing instead of an exists() stat per email
+    converted_ids = {md_file.stem for md_file in Path(markdown_dir).glob("*.md")}
 
-        try:
-            # Skip if markdown already exists (already converted or parsed)
-            markdown_file = Path(markdown_dir) / f"{message_id}.md"
-            if markdown_file.exists():
-                logger.debug(f"Skipping {message_id} - markdown already exists")
-                continue
+    with transaction(durable=False):
+        for email_file in email_files:
+            message_id = email_file.stem
 
-            # Load email
-            with open(email_file, "r", encoding="utf-8") as f:
-                email = json.load(f)
+            try:
+                # Skip if markdown already exists (already converted or parsed)
+                if message_id in converted_ids:
+                    logger.debug(f"Skipping {message_id} - markdown already exists")
+                    continue
 
-            # Convert to markdown
-            markdown_content = convert_to_markdown(email)
+                # Load email
+                with open(email_file, "r", encoding="utf-8") as f:
+                    email = json.load(f)
 
-            # Save markdown
-            save_markdown(message_id, markdown_content, markdown_dir)
+                # Convert to markdown
+                markdown_content = convert_to_markdown(email)
 
-            # Update status to converted
-            repo.track_email_processed(message_id, email.get("sender"), "converted")
+                # A failure rolls back this email's row only, not the batch.
+                # The status is written first so a failed write leaves no
+                # markdown behind and the email is retried next run
+                with savepoint():
+                    # Update status to converted
+                    repo.track_email_processed(message_id, email.get("sender"), "converted")
 
-            emails_converted += 1
+                    # Save markdown
+                    save_markdown(message_id, markdown_content, markdown_dir)
 
-        except Exception as e:
-            result["errors"].append(
-                f"Failed to convert {email_file.name}: {str(e)}"
-            )
-            continue
+                emails_converted += 1
+
+            except Exception as e:
+                result["errors"].append(
+                    f"Failed to convert {email_file.name}: {str(e)}"
+                )
+                continue
 
     result["success"] = True
     result["emails_converted"] = emails_converted
@@ -239,7 +250,7 @@ def _parse_single_newsletter(
     senders: dict,
     default_parsing_prompt: str,
     model_name: str,
-    parsed_dir: str,
+    parsed_dir: Optional[str],
     total_count: int,
     index: int,
 ) -> tuple[str, bool, str, list]:
@@ -252,7 +263,7 @@ def _parse_single_newsletter(
         senders: Dictionary of sender configurations
         default_parsing_prompt: Default parsing prompt
         model_name: Gemini model name to use
-        parsed_dir: Directory to save parsed items
+        parsed_dir: Directory to export parsed items as JSON, or None to skip
         total_count: Total number of files being processed
         index: Current file index (1-based)
 
@@ -265,22 +276,6 @@ def _parse_single_newsletter(
     repo = Repository()
 
     try:
-        # Check if already parsed by checking if feed items exist for this message
-        from src.db.connection import get_connection
-        with get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(
-                    """
-                    SELECT status FROM processed_emails WHERE message_id = %s
-                    """,
-                    (message_id,)
-                )
-                email_status = cursor.fetchone()
-
-            if email_status and email_status[0] == "parsed":
-                logger.info(f"[{index}/{total_count}] Skipping {message_id} - already parsed")
-                return (message_id, True, None, [])
-        
         # Load markdown content
         with open(markdown_file, "r", encoding="utf-8") as f:
             markdown_content = f.read()
@@ -310,16 +305,19 @@ def _parse_single_newsletter(
         parsed_items = parse_newsletter(markdown_content, parsing_prompt, llm_client, model_name)
         logger.info(f"[{index}/{total_count}] Extracted {len(parsed_items)} items from {message_id}")
 
-        # Save parsed items to file and convert to FeedItem format for PostgreSQL
+        # Convert parsed items to FeedItem format for PostgreSQL
         if parsed_items:
             from datetime import datetime, timezone
             from src.models.feed_item import FeedItem
             from src.newsletter.id_generation import generate_newsletter_id
 
-            # Save to file for legacy compatibility
-            save_parsed_items(message_id, parsed_items, parsed_dir)
+            # Optional JSON export; PostgreSQL is the source of truth
+            if parsed_dir:
+                save_parsed_items(message_id, parsed_items, parsed_dir)
 
             # Convert to FeedItem objects and save to PostgreSQL
+            # (one timestamp for the batch, used as fetched_at and date fallback)
+            now = datetime.now(timezone.utc)
             feed_items = []
             for item in parsed_items:
                 try:
@@ -333,11 +331,11 @@ def _parse_single_newsletter(
                     date_str = item.get("date", "")
                     try:
                         if date_str:
-                            item_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                            item_date = datetime.fromisoformat(date_str)
                         else:
-                            item_date = datetime.now(timezone.utc)
+                            item_date = now
                     except (ValueError, AttributeError):
-                        item_date = datetime.now(timezone.utc)
+                        item_date = now
 
                     # Ensure timezone-aware datetime
                     if item_date.tzinfo is None:
@@ -359,16 +357,18 @@ def _parse_single_newsletter(
                         summary=item.get("summary"),
                         link=item.get("link"),
                         metadata=metadata,
-                        fetched_at=datetime.now(timezone.utc),
+                        fetched_at=now,
                     )
                     feed_items.append(feed_item)
                 except Exception as e:
                     logger.warning(f"Failed to convert item to FeedItem: {e}")
                     continue
 
-            # Save all feed items to PostgreSQL
+            # Save all feed items to PostgreSQL; they can be re-parsed, so
+            # don't wait on the WAL flush
             if feed_items:
-                repo.save_feed_items(feed_items)
+                with transaction(durable=False):
+                    repo.save_feed_items(feed_items)
 
         # Update status
         repo.track_email_processed(message_id, sender_email, "parsed")
@@ -389,7 +389,7 @@ def _parse_single_newsletter(
 
 def parse_newsletters(
     markdown_dir: str = "data/markdown",
-    parsed_dir: str = "data/parsed",
+    parsed_dir: Optional[str] = None,
     config_path: str = "config/senders.json",
     emails_dir: str = "data/emails",
     max_workers: int = 5,
@@ -403,7 +403,8 @@ def parse_newsletters(
 
     Args:
         markdown_dir: Directory containing markdown files
-        parsed_dir: Directory to save parsed JSON files
+        parsed_dir: Directory to also export parsed items as JSON files
+            (default: None - items are only stored in PostgreSQL)
         config_path: Path to config/senders.json
         emails_dir: Directory containing email files (to get sender info)
         max_workers: Maximum number of parallel workers (default: 5)
@@ -417,7 +418,7 @@ def parse_newsletters(
     Side Effects:
         - Reads markdown files from data/markdown/
         - Makes LLM API calls (in parallel)
-        - Saves parsed items to data/parsed/
+        - Saves parsed items to PostgreSQL (and parsed_dir, if given)
         - Updates database status to 'parsed' or 'error'
     """
     result = {
@@ -473,6 +474,16 @@ def parse_newsletters(
         result["success"] = True  # Not an error, just nothing to do
         return result
 
+    # Skip files already parsed in an earlier run with one status query up
+    # front, so incremental runs only touch newly converted newsletters
+    parsed_ids = Repository().get_processed_message_ids(status="parsed")
+    markdown_files = [f for f in markdown_files if f.stem not in parsed_ids]
+
+    if not markdown_files:
+        logger.info("All markdown files already parsed")
+        result["success"] = True
+        return result
+
     total_files = len(markdown_files)
     logger.info(f"Found {total_files} markdown files to process (using {max_workers} parallel workers, model: {parsing_model})")
     
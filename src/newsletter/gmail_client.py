@@ -4,6 +4,8 @@ import base64
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from google.auth.exceptions import RefreshError
@@ -17,6 +19,9 @@ logger = logging.getLogger(__name__)
 # Gmail API scopes
 SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
 
+# Senders queried concurrently by collect_emails()
+_MAX_FETCH_WORKERS = 8
+
 
 def authenticate_gmail(
     credentials_path: str, tokens_path: str = "data/tokens.json"
@@ -127,105 +132,139 @@ def collect_emails(
     if not sender_emails:
         return []
 
-    # Build Gmail service
-    service = build("gmail", "v1", credentials=credentials)
-
     # Calculate date for lookback filter
     from datetime import datetime, timedelta
     cutoff_date = datetime.now() - timedelta(days=days_lookback)
     date_filter = cutoff_date.strftime("%Y/%m/%d")
 
-    # Collect emails per sender to enforce max_per_sender limit
-    all_emails = []
-    sender_counts = {email.lower(): 0 for email in sender_emails}
-
-    # Query each sender separately to get most recent emails per sender
-    for sender_email in sender_emails:
-        query = f"from:{sender_email} after:{date_filter}"
-
-        # Get list of messages for this sender
-        results = (
-            service.users()
-            .messages()
-            .list(userId="me", q=query, maxResults=max_per_sender)
-            .execute()
+    # googleapiclient services are not thread-safe; each worker builds its own
+    local = threading.local()
+
+    def collect_sender(sender_email: str) -> list[dict]:
+        service = getattr(local, "service", None)
+        if service is None:
+            service = local.service = build("gmail", "v1", credentials=credentials)
+        return _collect_sender_emails(
+            service, sender_email, processed_ids, date_filter, max_per_sender
         )
 
-        messages = results.get("messages", [])
+    # Query each sender separately to get most recent emails per sender;
+    # the requests are network-bound, so senders are fetched concurrently
+    all_emails = []
+    max_workers = min(_MAX_FETCH_WORKERS, len(sender_emails))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # map() yields in sender order, so output order is unchanged
+        for sender_result in executor.map(collect_sender, sender_emails):
+            all_emails.extend(sender_result)
 
-        for msg in messages:
-            message_id = msg["id"]
+    return all_emails
 
-            # Skip if already processed
-            if message_id in processed_ids:
-                continue
 
-            try:
-                # Get full message
-                message = (
-                    service.users()
-                    .messages()
-                    .get(userId="me", id=message_id, format="full")
-                    .execute()
-                )
+def _collect_sender_emails(
+    service,
+    sender_email: str,
+    processed_ids: set[str],
+    date_filter: str,
+    max_per_sender: int,
+) -> list[dict]:
+    """Collect the most recent unprocessed emails from one sender.
 
-                # Extract headers
-                headers = {}
-                payload = message.get("payload", {})
-                for header in payload.get("headers", []):
-                    headers[header["name"].lower()] = header["value"]
-
-                # Extract sender from headers
-                from_header = headers.get("from", "")
-
-                # Extract email from "Name <email@example.com>" format or plain email
-                actual_sender = from_header
-                if "<" in from_header:
-                    # Extract email from "Name <email@example.com>"
-                    actual_sender = from_header.split("<")[1].split(">")[0].strip()
-                else:
-                    # Plain email address
-                    actual_sender = from_header.strip()
-
-                # Extract body content
-                body_html = None
-                body_text = None
-
-                # Handle multipart messages
-                if "parts" in payload:
-                    for part in payload["parts"]:
-                        mime_type = part.get("mimeType", "")
-                        body_data = part.get("body", {}).get("data", "")
-
-                        if mime_type == "text/html" and body_data:
-                            body_html = base64.urlsafe_b64decode(body_data).decode("utf-8")
-                        elif mime_type == "text/plain" and body_data:
-                            body_text = base64.urlsafe_b64decode(body_data).decode("utf-8")
-                else:
-                    # Single part message
-                    mime_type = payload.get("mimeType", "")
-                    body_data = payload.get("body", {}).get("data", "")
-                    if mime_type == "text/html" and body_data:
-                        body_html = base64.urlsafe_b64decode(body_data).decode("utf-8")
-                    elif mime_type == "text/plain" and body_data:
-                        body_text = base64.urlsafe_b64decode(body_data).decode("utf-8")
+    Args:
+        service: Gmail API service (used by this thread only)
+        sender_email: Sender email address to query
+        processed_ids: Set of message IDs already processed
+        date_filter: Gmail "after:" date (YYYY/MM/DD)
+        max_per_sender: Maximum emails to collect for this sender
 
-                # Build email dict
-                email_dict = {
-                    "message_id": message_id,
-                    "sender": actual_sender,
-                    "subject": headers.get("subject", ""),
-                    "date": headers.get("date", ""),
-                    "body_html": body_html,
-                    "body_text": body_text,
-                    "headers": headers,
-                }
+    Returns:
+        list[dict]: Email dictionaries as returned by collect_emails()
+    """
+    query = f"from:{sender_email} after:{date_filter}"
 
-                all_emails.append(email_dict)
+    # Get list of messages for this sender
+    results = (
+        service.users()
+        .messages()
+        .list(userId="me", q=query, maxResults=max_per_sender)
+        .execute()
+    )
 
-            except Exception as e:
-                # Log error but continue with other emails
-                logger.error(f"Error processing message {message_id}: {e}")
-                continue
+    messages = results.get("messages", [])
+    emails = []
 
-    return all_emails
+    for msg in messages:
+        message_id = msg["id"]
+
+        # Skip if already processed
+        if message_id in processed_ids:
+            continue
+
+        try:
+            # Get full message
+            message = (
+                service.users()
+                .messages()
+                .get(userId="me", id=message_id, format="full")
+                .execute()
+            )
+
+            # Extract headers
+            headers = {}
+            payload = message.get("payload", {})
+            for header in payload.get("headers", []):
+                headers[header["name"].lower()] = header["value"]
+
+            # Extract sender from headers
+            from_header = headers.get("from", "")
+
+            # Extract email from "Name <email@example.com>" format or plain email
+            actual_sender = from_header
+            if "<" in from_header:
+                # Extract email from "Name <email@example.com>"
+                actual_sender = from_header.split("<")[1].split(">")[0].strip()
+            else:
+                # Plain email address
+                actual_sender = from_header.strip()
+
+            # Extract body content
+            body_html = None
+            body_text = None
+
+            # Handle multipart messages
+            if "parts" in payload:
+                for part in payload["parts"]:
+                    mime_type = part.get("mimeType", "")
+                    body_data = part.get("body", {}).get("data", "")
+
+                    if mime_type == "text/html" and body_data:
+                        body_html = base64.urlsafe_b64decode(body_data).decode("utf-8")
+                    elif mime_type == "text/plain" and body_data:
+                        body_text = base64.urlsafe_b64decode(body_data).decode("utf-8")
+            else:
+                # Single part message
+                mime_type = payload.get("mimeType", "")
+                body_data = payload.get("body", {}).get("data", "")
+                if mime_type == "text/html" and body_data:
+                    body_html = base64.urlsafe_b64decode(body_data).decode("utf-8")
+                elif mime_type == "text/plain" and body_data:
+                    body_text = base64.urlsafe_b64decode(body_data).decode("utf-8")
+
+            # Build email dict
+            email_dict = {
+                "message_id": message_id,
+                "sender": actual_sender,
+                "subject": headers.get("subject", ""),
+                "date": headers.get("date", ""),
+                "body_html": body_html,
+                "body_text": body_text,
+                "headers": headers,
+            }
+
+            emails.append(email_dict)
+
+        except Exception as e:
+            # Log error but continue with other emails
+            logger.error(f"Error processing message {message_id}: {e}")
+            continue
+
+    return emails
@@ -3,6 +3,7 @@
 import base64
 import json
 import os
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -68,6 +69,8 @@ def create_llm_client(api_key: Optional[str] = None) -> genai.Client:
     Create Gemini LLM client.
 
     Creates a client for making LLM API calls using Google's Gemini API.
+    Clients are cached per API key, so the parsing and dedup steps of a
+    run (and later runs) share one client and its HTTP connections.
 
     Args:
         api_key: Optional API key. If not provided, reads from GEMINI_API_KEY environment variable.
@@ -87,9 +90,13 @@ def create_llm_client(api_key: Optional[str] = None) -> genai.Client:
             "Set GEMINI_API_KEY environment variable or pass api_key parameter."
         )
 
-    # Create client with API key
-    client = genai.Client(api_key=api_key)
-    return client
+    return _client_for_key(api_key)
+
+
+@lru_cache(maxsize=4)
+def _client_for_key(api_key: str) -> genai.Client:
+    """Create (once per API key) a Gemini client."""
+    return genai.Client(api_key=api_key)
 
 
 def parse_newsletter(
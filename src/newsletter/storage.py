@@ -6,11 +6,52 @@ Database operations have been migrated to PostgreSQL repository (src/db/reposito
 
 import json
 import logging
+import operator
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
 
 logger = logging.getLogger(__name__)
 
+# Single background worker for digest audio generation (TTS is serialised)
+_AUDIO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="digest-audio")
+
+# FeedItem fields exported to the consolidator, fetched in one C-level call per item
+_PARSED_ITEM_FIELDS = operator.attrgetter("date", "title", "summary", "link")
+
+# Directories already created by this process; saves skip the mkdir syscalls
+_ensured_dirs: set[str] = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create path (and parents) once per process.
+
+    Args:
+        path: Directory that must exist before writing into it
+    """
+    key = str(path)
+    if key in _ensured_dirs:
+        return
+    with _ensured_dirs_lock:
+        if key not in _ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(key)
+
+
+def _dump_json(obj) -> bytes:
+    """Serialise obj to UTF-8 JSON bytes for the machine-read data files.
+
+    json.dumps without indent runs on the C encoder in one call; indent=2 or
+    json.dump to a file handle both fall back to the pure-Python encoder and
+    issue a write per token.
+    """
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
 def init_data_directories(base_data_dir: str = "data") -> None:
     """Initialize data directory structure.
@@ -39,6 +80,11 @@ def init_data_directories(base_data_dir: str = "data") -> None:
         base_path / "output",  # data/output/
     ]
 
+    # Usually all present already: a stat each, no mkdir attempts. Checked
+    # every call so a deleted subdirectory is recreated
+    if all(directory.is_dir() for directory in directories):
+        return
+
     for directory in directories:
         directory.mkdir(parents=True, exist_ok=True)
 
@@ -68,12 +114,11 @@ def save_email(email: dict, data_dir: str) -> str:
         raise KeyError("Email dictionary must have 'message_id' key")
 
     data_dir_obj = Path(data_dir)
-    data_dir_obj.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(data_dir_obj)
 
     file_path = data_dir_obj / f"{email['message_id']}.json"
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(email, f, indent=2, ensure_ascii=False)
+    file_path.write_bytes(_dump_json(email))
 
     return str(file_path)
 
@@ -104,12 +149,12 @@ def save_markdown(message_id: str, markdown_content: str, data_dir: str) -> str:
         raise ValueError("message_id must be non-empty")
 
     data_dir_obj = Path(data_dir)
-    data_dir_obj.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(data_dir_obj)
 
     file_path = data_dir_obj / f"{message_id}.md"
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(markdown_content)
+    # Encode once and write in a single call (bypasses the incremental text encoder)
+    file_path.write_bytes(markdown_content.encode("utf-8"))
 
     return str(file_path)
 
@@ -142,12 +187,11 @@ def save_parsed_items(
         raise ValueError("message_id must be non-empty")
 
     data_dir_obj = Path(data_dir)
-    data_dir_obj.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(data_dir_obj)
 
     file_path = data_dir_obj / f"{message_id}.json"
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(parsed_items, f, indent=2, ensure_ascii=False)
+    file_path.write_bytes(_dump_json(parsed_items))
 
     return str(file_path)
 
@@ -158,6 +202,9 @@ def get_last_digest_timestamp(output_dir: str = "data/output") -> datetime | Non
     Parses digest filenames to find the most recent one and extracts its timestamp.
     Returns None if no digest files exist.
 
+    Results are cached keyed on the directory's mtime, so repeated calls are a
+    single stat until a file is added to or removed from output_dir.
+
     Args:
         output_dir: Output directory path (default: 'data/output')
 
@@ -169,9 +216,19 @@ def get_last_digest_timestamp(output_dir: str = "data/output") -> datetime | Non
     """
     output_dir_obj = Path(output_dir)
 
-    if not output_dir_obj.exists():
+    try:
+        mtime_ns = output_dir_obj.stat().st_mtime_ns
+    except FileNotFoundError:
         return None
 
+    return _last_digest_timestamp(output_dir, mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _last_digest_timestamp(output_dir: str, mtime_ns: int) -> datetime | None:
+    """Scan output_dir for the newest digest (cached per directory mtime)."""
+    output_dir_obj = Path(output_dir)
+
     # Find all digest files matching pattern: digest_YYYYMMDD_HHMMSS_ffffff.md
     digest_files = list(output_dir_obj.glob("digest_*.md"))
 
@@ -205,78 +262,101 @@ def get_last_digest_timestamp(output_dir: str = "data/output") -> datetime | Non
         return None
 
 
-def save_consolidated_digest(markdown_content: str, output_dir: str) -> str:
+def _generate_digest_audio(file_path: Path) -> str | None:
+    """Generate the MP3 audio file for a saved digest.
+
+    Runs on the background audio pool; failures are logged, never raised.
+
+    Args:
+        file_path: Path to the saved digest markdown file
+
+    Returns:
+        str | None: Name of the TTS provider used, or None if generation failed
+    """
+    try:
+        from src.services.audio.audio_generator import generate_audio_for_newsletter
+
+        logger.info(f"Generating audio for newsletter: {file_path}")
+        audio_result = generate_audio_for_newsletter(file_path)
+
+        if audio_result.success:
+            logger.info(
+                f"Audio generated successfully: {audio_result.output_path} "
+                f"({audio_result.items_processed}/{audio_result.total_items} items, "
+                f"{audio_result.duration_seconds:.2f}s, provider: {audio_result.provider_used})"
+            )
+        else:
+            logger.warning(
+                f"Audio generation failed or incomplete: "
+                f"{audio_result.items_processed}/{audio_result.total_items} items processed. "
+                f"Error: {audio_result.error_message}"
+            )
+        return audio_result.provider_used or None
+    except Exception as e:
+        # Don't fail newsletter save if audio generation fails
+        logger.error(f"Audio generation failed: {e}", exc_info=True)
+        return None
+
+
+def save_consolidated_digest(
+    markdown_content: str, output_dir: str
+) -> tuple[str, Future]:
     """Save consolidated newsletter digest to file system.
 
     Saves markdown content to a timestamped file in the specified directory.
     File is named: digest_{timestamp}.md
-    Also generates an MP3 audio file via text-to-speech if ElevenLabs API is configured.
+    Audio generation (TTS) is queued on a background worker so the caller
+    is not blocked for the duration of the TTS run.
 
     Args:
         markdown_content: Markdown text of consolidated newsletter
         output_dir: Base output directory path (e.g., 'data/output')
 
     Returns:
-        str: Path to saved file
+        tuple[str, Future]: Path to saved file, and a Future resolving to the
+            TTS provider name used (or None if audio generation failed)
 
     Side Effects:
         - Creates file {output_dir}/digest_{timestamp}.md
         - Writes markdown content
-        - Optionally creates {output_dir}/digest_{timestamp}.mp3 (audio file)
+        - Queues creation of {output_dir}/digest_{timestamp}.mp3 (audio file)
         - Creates directory if needed
 
     Raises:
         ValueError: If markdown_content is empty
     """
-    if not markdown_content or not markdown_content.strip():
+    # str.isspace() scans in place instead of allocating a stripped copy
+    if not markdown_content or markdown_content.isspace():
         raise ValueError("markdown_content must be non-empty")
 
     output_dir_obj = Path(output_dir)
-    output_dir_obj.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_dir_obj)
 
     # Generate timestamp in format: YYYYMMDD_HHMMSS_ffffff (includes microseconds for uniqueness)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     file_path = output_dir_obj / f"digest_{timestamp}.md"
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(markdown_content)
+    # Write to a temp file and atomically rename so readers (the audio job,
+    # get_last_digest_timestamp) never observe a partially written digest
+    tmp_path = file_path.with_suffix(".md.tmp")
+    tmp_path.write_bytes(markdown_content.encode("utf-8"))
+    os.replace(tmp_path, file_path)
 
-    # Generate audio file for newsletter
-    audio_provider = None
-    try:
-        from src.services.audio.audio_generator import generate_audio_for_newsletter
+    # Generate audio file for newsletter off the caller's path
+    audio_future = _AUDIO_POOL.submit(_generate_digest_audio, file_path)
 
-        logger.info(f"Generating audio for newsletter: {file_path}")
-        audio_result = generate_audio_for_newsletter(file_path)
-        audio_provider = audio_result.provider_used or None
-
-        if audio_result.success:
-            logger.info(
-                f"Audio generated successfully: {audio_result.output_path} "
-                f"({audio_result.items_processed}/{audio_result.total_items} items, "
-                f"{audio_result.duration_seconds:.2f}s, provider: {audio_result.provider_used})"
-            )
-        else:
-            logger.warning(
-                f"Audio generation failed or incomplete: "
-                f"{audio_result.items_processed}/{audio_result.total_items} items processed. "
-                f"Error: {audio_result.error_message}"
-            )
-    except Exception as e:
-        # Don't fail newsletter save if audio generation fails
-        logger.error(f"Audio generation failed: {e}", exc_info=True)
-
-    return str(file_path), audio_provider
+    return str(file_path), audio_future
 
 
-def get_recent_parsed_items(
+def iter_recent_parsed_items(
     db_path: str, days: int | None = None, since: datetime | None = None
-) -> list[dict]:
-    """Get parsed newsletter items from the last N days or since a specific datetime.
+) -> Iterator[dict]:
+    """Yield parsed newsletter items from the last N days or since a specific datetime.
 
-    Queries PostgreSQL feed_items table for newsletter items within the
-    specified number of days OR since a specific datetime. The db_path parameter
-    is kept for backward compatibility but is ignored (PostgreSQL connection used instead).
+    Streaming variant of get_recent_parsed_items(): the database connection is
+    only held while the rows are fetched, and each dict is built lazily as the
+    caller iterates, so the full list of dicts is never resident alongside the
+    FeedItem objects.
 
     Args:
         db_path: Ignored (kept for backward compatibility)
@@ -284,8 +364,8 @@ def get_recent_parsed_items(
         since: Get items since this datetime (default: None)
               If both days and since are None, defaults to 1 day
 
-    Returns:
-        list[dict]: List of parsed items, each with keys: date, title, summary, link
+    Yields:
+        dict: Parsed item with keys: date, title, summary, link
 
     Side Effects:
         - Reads from PostgreSQL feed_items table via Repository
@@ -309,13 +389,36 @@ def get_recent_parsed_items(
             feed_items = repo.get_feed_items(source_type="newsletter", days=days)
 
     # Convert FeedItem objects to dict format expected by consolidator
-    items = []
-    for item in feed_items:
-        items.append({
-            "date": item.date.isoformat() if item.date else None,
-            "title": item.title,
-            "summary": item.summary or "",
-            "link": item.link,
-        })
-
-    return items
+    for date, title, summary, link in map(_PARSED_ITEM_FIELDS, feed_items):
+        yield {
+            "date": date.isoformat() if date else None,
+            "title": title,
+            "summary": summary or "",
+            "link": link,
+        }
+
+
+def get_recent_parsed_items(
+    db_path: str, days: int | None = None, since: datetime | None = None
+) -> list[dict]:
+    """Get parsed newsletter items from the last N days or since a specific datetime.
+
+    Queries PostgreSQL feed_items table for newsletter items within the
+    specified number of days OR since a specific datetime. The db_path parameter
+    is kept for backward compatibility but is ignored (PostgreSQL connection used instead).
+
+    Thin wrapper around iter_recent_parsed_items() for callers that need a list.
+
+    Args:
+        db_path: Ignored (kept for backward compatibility)
+        days: Number of days to look back (default: None)
+        since: Get items since this datetime (default: None)
+              If both days and since are None, defaults to 1 day
+
+    Returns:
+        list[dict]: List of parsed items, each with keys: date, title, summary, link
+
+    Side Effects:
+        - Reads from PostgreSQL feed_items table via Repository
+    """
+    return list(iter_recent_parsed_items(db_path, days=days, since=since))
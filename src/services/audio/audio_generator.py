@@ -2,20 +2,27 @@
 
 import hashlib
 import logging
+import os
+import secrets
 import subprocess
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
 from src.models.audio_models import (
     AudioConfig,
     AudioGenerationResult,
     AudioSegment,
+    NewsletterItem,
     TTSRequest,
 )
+from src.services.audio.ffmpeg import FFMPEG_BASE, MAX_TTS_WORKERS
 from src.services.audio.markdown_parser import parse_newsletter_items
 from src.services.audio.tts_service import get_tts_provider
-from src.services.audio import TTSError
+from src.services.audio import TTSError, TTSProvider
 
 logger = logging.getLogger(__name__)
 
@@ -23,37 +30,96 @@ logger = logging.getLogger(__name__)
 CACHE_DIR = Path("data/audio_cache")
 
 
-def get_content_hash(link: str | None, voice_id: str, title: str | None = None, date: str | None = None) -> str:
+@lru_cache(maxsize=1024)
+def _hash_cache_key(*parts: str) -> str:
+    """
+    Hash ":"-joined cache key parts to the 16-character cache file stem.
+
+    The parts are fed to the hasher one at a time rather than formatted into
+    one string first; the digest is the same either way, so existing cache
+    files keep their names. Memoized because each item's key is hashed on
+    both the cache lookup and the cache write (or source path) within a run.
+
+    Args:
+        parts: Cache key components (link or title+date, then voice ID)
+
+    Returns:
+        16-character hash string
+    """
+    hasher = hashlib.sha256(parts[0].encode())
+    for part in parts[1:]:
+        hasher.update(b":")
+        hasher.update(part.encode())
+    return hasher.hexdigest()[:16]
+
+
+def get_content_hash(
+    link: str | None,
+    voice_id: str,
+    title: str | None = None,
+    date: str | None = None,
+    text: str | None = None,
+) -> str:
     """
     Generate a hash for article identification + voice combination.
 
     Uses article link (if available) for stable caching across LLM regenerations.
-    Falls back to title+date if link is not available.
+    Falls back to title+date if link is not available, then to the spoken
+    text itself, so identical text is never synthesized twice.
 
     Args:
         link: Article URL (preferred)
         voice_id: Voice ID used
         title: Article title (fallback if no link)
         date: Article date in YYYY-MM-DD format (fallback if no link)
+        text: Text being spoken (fallback if no link or title+date)
 
     Returns:
         16-character hash string
     """
     if link:
         # Use stable link for caching (survives LLM rewrites)
-        content = f"{link}:{voice_id}"
-    elif title and date:
+        return _hash_cache_key(link, voice_id)
+    if title and date:
         # Fallback: use title+date for items without links
-        content = f"{title}:{date}:{voice_id}"
-    else:
-        # Last resort: generate random hash (no caching benefit)
-        import time
-        content = f"nocache:{time.time()}:{voice_id}"
+        return _hash_cache_key(title, date, voice_id)
+    if text:
+        # Content-addressed: same text + voice gives the same audio
+        return _hash_cache_key("text", text, voice_id)
+    # Last resort: random hash (no caching benefit)
+    return secrets.token_hex(8)
+
+
+def get_cache_path(
+    link: str | None,
+    voice_id: str,
+    title: str | None = None,
+    date: str | None = None,
+    text: str | None = None,
+) -> Path:
+    """
+    Return the cache file path for given article + voice.
 
-    return hashlib.sha256(content.encode()).hexdigest()[:16]
+    Args:
+        link: Article URL (for cache stability)
+        voice_id: Voice ID used
+        title: Article title (fallback if no link)
+        date: Article date in YYYY-MM-DD format (fallback if no link)
+        text: Text being spoken (fallback if no link or title+date)
+
+    Returns:
+        Path of the WAV file in CACHE_DIR
+    """
+    return CACHE_DIR / f"{get_content_hash(link, voice_id, title, date, text)}.wav"
 
 
-def get_cached_audio(link: str | None, voice_id: str, title: str | None = None, date: str | None = None) -> bytes | None:
+def get_cached_audio(
+    link: str | None,
+    voice_id: str,
+    title: str | None = None,
+    date: str | None = None,
+    text: str | None = None,
+) -> bytes | None:
     """
     Retrieve cached audio for given article.
 
@@ -62,12 +128,12 @@ def get_cached_audio(link: str | None, voice_id: str, title: str | None = None,
         voice_id: Voice ID used
         title: Article title (fallback if no link)
         date: Article date in YYYY-MM-DD format (fallback if no link)
+        text: Text being spoken (fallback if no link or title+date)
 
     Returns:
         Audio bytes (WAV) if cached, None otherwise
     """
-    cache_key = get_content_hash(link, voice_id, title, date)
-    cache_file = CACHE_DIR / f"{cache_key}.wav"
+    cache_file = get_cache_path(link, voice_id, title, date, text)
 
     if cache_file.exists():
         logger.info(f"Cache hit for {title or link[:50] if link else 'unknown'}...")
@@ -76,7 +142,14 @@ def get_cached_audio(link: str | None, voice_id: str, title: str | None = None,
     return None
 
 
-def cache_audio(link: str | None, voice_id: str, audio_bytes: bytes, title: str | None = None, date: str | None = None) -> None:
+def cache_audio(
+    link: str | None,
+    voice_id: str,
+    audio_bytes: bytes,
+    title: str | None = None,
+    date: str | None = None,
+    text: str | None = None,
+) -> Path:
     """
     Cache audio for given article.
 
@@ -86,13 +159,22 @@ def cache_audio(link: str | None, voice_id: str, audio_bytes: bytes, title: str
         audio_bytes: Audio data to cache (WAV format)
         title: Article title (fallback if no link)
         date: Article date in YYYY-MM-DD format (fallback if no link)
+        text: Text being spoken (fallback if no link or title+date)
+
+    Returns:
+        Path of the written cache file
     """
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    cache_key = get_content_hash(link, voice_id, title, date)
-    cache_file = CACHE_DIR / f"{cache_key}.wav"
-
-    cache_file.write_bytes(audio_bytes)
+    cache_file = get_cache_path(link, voice_id, title, date, text)
+
+    # Write to a temp file and atomically rename, so a concurrent lookup never
+    # reads (or hands ffmpeg) a partially written segment. The temp name is
+    # per thread because parallel workers may cache the same segment.
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+    tmp_file.write_bytes(audio_bytes)
+    os.replace(tmp_file, cache_file)
     logger.info(f"Cached audio (WAV) for {title or link[:50] if link else 'unknown'}...")
+    return cache_file
 
 
 def concatenate_audio_segments(segments: list[AudioSegment]) -> bytes:
@@ -114,60 +196,28 @@ def concatenate_audio_segments(segments: list[AudioSegment]) -> bytes:
     with tempfile.TemporaryDirectory() as tmpdir:
         tmpdir_path = Path(tmpdir)
 
-        # Save each segment to a temp file and normalize with ffmpeg
-        normalized_files = []
+        # Feed ffmpeg each segment's existing file (audio cache) where there
+        # is one; only segments held purely in memory go to a temp file
+        input_files = []
         for i, segment in enumerate(segments):
+            if segment.source_path is not None:
+                input_files.append(segment.source_path)
+                continue
             input_file = tmpdir_path / f"segment_{i:03d}_input.wav"
-            output_file = tmpdir_path / f"segment_{i:03d}_normalized.wav"
-
-            # Write segment to temp file
             input_file.write_bytes(segment.audio_bytes)
+            input_files.append(input_file)
 
-            try:
-                # Normalize audio using ffmpeg loudnorm filter
-                # This ensures consistent volume levels across all segments
-                subprocess.run(
-                    [
-                        "ffmpeg",
-                        "-i",
-                        str(input_file),
-                        "-af",
-                        "loudnorm=I=-16:TP=-1.5:LRA=11",  # EBU R128 normalization
-                        "-y",  # Overwrite output file
-                        str(output_file),
-                    ],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-                normalized_files.append(output_file)
-            except subprocess.CalledProcessError as e:
-                logger.warning(
-                    f"Failed to normalize segment {segment.item_number}: {e.stderr}"
-                )
-                # Fall back to original file without normalization
-                normalized_files.append(input_file)
-
-        # Create concat file list for ffmpeg
-        concat_file = tmpdir_path / "concat_list.txt"
-        with open(concat_file, "w") as f:
-            for file_path in normalized_files:
-                # Use forward slashes for ffmpeg compatibility
-                file_str = str(file_path).replace("\\", "/")
-                f.write(f"file '{file_str}'\n")
-
-        # Concatenate all normalized segments and encode to MP3
+        # Normalize and concatenate everything in a single ffmpeg process
         output_file = tmpdir_path / "combined.mp3"
         try:
             subprocess.run(
                 [
-                    "ffmpeg",
-                    "-f",
-                    "concat",
-                    "-safe",
-                    "0",
-                    "-i",
-                    str(concat_file),
+                    *FFMPEG_BASE,
+                    *(arg for input_file in input_files for arg in ("-i", str(input_file))),
+                    "-filter_complex",
+                    _normalize_concat_filter(len(input_files)),
+                    "-map",
+                    "[out]",
                     "-c:a",
                     "libmp3lame",  # Encode to MP3
                     "-b:a",
@@ -176,18 +226,218 @@ def concatenate_audio_segments(segments: list[AudioSegment]) -> bytes:
                     str(output_file),
                 ],
                 check=True,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,  # Audio is written to the output file
+                stderr=subprocess.PIPE,
                 text=True,
             )
-
-            # Read and return the combined audio
             return output_file.read_bytes()
+        except subprocess.CalledProcessError as e:
+            logger.warning(
+                f"Single-pass normalize+concat failed, retrying per segment: {e.stderr}"
+            )
+
+        return _concatenate_per_segment(segments, input_files, tmpdir_path)
+
+
+def _normalize_concat_filter(count: int) -> str:
+    """
+    Build an ffmpeg filter graph that normalizes and joins count inputs.
+
+    Each input gets its own EBU R128 loudnorm pass (so male and female voices
+    match), is converted to a common 24 kHz mono format (loudnorm resamples
+    to 192 kHz, and concat needs identical formats), then all streams are
+    concatenated into the [out] pad.
+
+    loudnorm runs in single-pass (dynamic) mode because no measured_* values
+    are supplied. That is deliberate: two-pass normalization needs a separate
+    analysis run per input, roughly doubling the cost, and single-pass is
+    accurate enough for short synthetic TTS speech. Do not switch to two-pass.
+
+    Args:
+        count: Number of audio inputs
+
+    Returns:
+        Value for ffmpeg's -filter_complex option
+    """
+    normalize = ";".join(
+        f"[{i}:a]loudnorm=I=-16:TP=-1.5:LRA=11,"
+        f"aformat=sample_rates=24000:channel_layouts=mono[a{i}]"
+        for i in range(count)
+    )
+    inputs = "".join(f"[a{i}]" for i in range(count))
+    return f"{normalize};{inputs}concat=n={count}:v=0:a=1[out]"
+
+
+def _concatenate_per_segment(
+    segments: list[AudioSegment], input_files: list[Path], tmpdir_path: Path
+) -> bytes:
+    """
+    Fallback for concatenate_audio_segments: one ffmpeg process per step.
+
+    Normalizes each segment separately (keeping the original for any segment
+    that fails), joins them with the concat demuxer, and as a last resort
+    returns the raw segment bytes joined together.
 
+    Args:
+        segments: Segments being concatenated
+        input_files: WAV files already written for each segment
+        tmpdir_path: Scratch directory for intermediate files
+
+    Returns:
+        Combined audio bytes (MP3, or raw concatenation on failure)
+    """
+    # Normalize each segment with ffmpeg
+    normalized_files = []
+    for i, (segment, input_file) in enumerate(zip(segments, input_files)):
+        output_file = tmpdir_path / f"segment_{i:03d}_normalized.wav"
+
+        try:
+            # Normalize audio using ffmpeg loudnorm filter
+            # This ensures consistent volume levels across all segments
+            subprocess.run(
+                [
+                    *FFMPEG_BASE,
+                    "-i",
+                    str(input_file),
+                    "-af",
+                    "loudnorm=I=-16:TP=-1.5:LRA=11",  # EBU R128, single-pass
+                    "-ac",
+                    "1",  # TTS output is mono
+                    "-ar",
+                    "24000",  # Undo loudnorm's 192 kHz upsampling
+                    "-c:a",
+                    "pcm_s16le",  # Identical sample format for every segment
+                    "-y",  # Overwrite output file
+                    str(output_file),
+                ],
+                check=True,
+                stdout=subprocess.DEVNULL,  # Audio is written to the output file
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            normalized_files.append(output_file)
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to concatenate audio segments: {e.stderr}")
-            # Fall back to simple byte concatenation
-            logger.warning("Falling back to simple concatenation without normalization")
-            return b"".join(segment.audio_bytes for segment in segments)
+            logger.warning(
+                f"Failed to normalize segment {segment.item_number}: {e.stderr}"
+            )
+            # Fall back to original file without normalization
+            normalized_files.append(input_file)
+
+    # Create concat file list for ffmpeg in a single write
+    # (as_posix: forward slashes for ffmpeg compatibility)
+    concat_file = tmpdir_path / "concat_list.txt"
+    concat_file.write_text(
+        "".join(f"file '{file_path.as_posix()}'\n" for file_path in normalized_files)
+    )
+
+    # Concatenate all normalized segments and encode to MP3
+    output_file = tmpdir_path / "combined.mp3"
+    try:
+        subprocess.run(
+            [
+                *FFMPEG_BASE,
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                str(concat_file),
+                "-c:a",
+                "libmp3lame",  # Encode to MP3
+                "-b:a",
+                "128k",  # 128kbps bitrate
+                "-y",
+                str(output_file),
+            ],
+            check=True,
+            stdout=subprocess.DEVNULL,  # Audio is written to the output file
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+        # Read and return the combined audio
+        return output_file.read_bytes()
+
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Failed to concatenate audio segments: {e.stderr}")
+        # Fall back to simple byte concatenation
+        logger.warning("Falling back to simple concatenation without normalization")
+        return b"".join(segment.audio_bytes for segment in segments)
+
+
+def _synthesize_item(
+    item: NewsletterItem,
+    tts_service: TTSProvider,
+    config: AudioConfig,
+    digest_date: str | None,
+    total_items: int,
+) -> AudioSegment:
+    """
+    Produce the audio segment for one newsletter item.
+
+    Uses the segment cache when possible, otherwise converts with the TTS
+    provider and caches the result. Safe to call from worker threads.
+
+    Args:
+        item: Parsed newsletter item
+        tts_service: TTS provider to convert with on a cache miss
+        config: Audio configuration (voice names)
+        digest_date: Digest date (YYYY-MM-DD) used as cache fallback key
+        total_items: Item count, for progress logging
+
+    Returns:
+        AudioSegment for the item
+
+    Raises:
+        TTSError: If conversion fails
+    """
+    # Select voice based on item number
+    voice_name = (
+        config.male_voice
+        if item.voice_gender == "male"
+        else config.female_voice
+    )
+
+    # Check cache first (using article link, title+date or text fallback)
+    speech_text = item.to_speech_text()
+    cached_audio = get_cached_audio(
+        item.link, voice_name, item.title, digest_date, text=speech_text
+    )
+
+    if cached_audio:
+        # Use cached audio
+        logger.info(
+            f"Using cached audio for item {item.item_number}/{total_items} (link: {item.link})"
+        )
+        return AudioSegment(
+            item_number=item.item_number,
+            audio_bytes=cached_audio,
+            voice_name=voice_name,
+            voice_gender=item.voice_gender,
+            source_path=get_cache_path(
+                item.link, voice_name, item.title, digest_date, text=speech_text
+            ),
+        )
+
+    # Generate new audio
+    logger.info(
+        f"Converting item {item.item_number}/{total_items} "
+        f"(voice: {item.voice_gender})"
+    )
+    request = TTSRequest(
+        text=speech_text,
+        voice_name=voice_name,
+    )
+    segment = tts_service.convert_to_speech(request)
+    segment.item_number = item.item_number
+
+    # Cache the audio (using article link, title+date or text fallback)
+    segment.source_path = cache_audio(
+        item.link, voice_name, segment.audio_bytes, item.title, digest_date,
+        text=speech_text,
+    )
+
+    return segment
 
 
 def generate_audio_for_newsletter(markdown_path: Path) -> AudioGenerationResult:
@@ -248,55 +498,27 @@ def generate_audio_for_newsletter(markdown_path: Path) -> AudioGenerationResult:
 
         logger.info(f"Generating audio for {total_items} items (date: {digest_date or 'unknown'})")
 
-        # Generate audio for each item
-        for item in items:
-            try:
-                # Select voice based on item number
-                voice_name = (
-                    config.male_voice
-                    if item.voice_gender == "male"
-                    else config.female_voice
-                )
-
-                text = item.to_speech_text()
-
-                # Check cache first (using article link or title+date fallback)
-                cached_audio = get_cached_audio(item.link, voice_name, item.title, digest_date)
-
-                if cached_audio:
-                    # Use cached audio
-                    logger.info(
-                        f"Using cached audio for item {item.item_number}/{total_items} (link: {item.link})"
-                    )
-                    segment = AudioSegment(
-                        item_number=item.item_number,
-                        audio_bytes=cached_audio,
-                        voice_name=voice_name,
-                        voice_gender=item.voice_gender,
-                    )
-                else:
-                    # Generate new audio
-                    logger.info(
-                        f"Converting item {item.item_number}/{total_items} "
-                        f"(voice: {item.voice_gender})"
-                    )
-                    request = TTSRequest(
-                        text=text,
-                        voice_name=voice_name,
-                    )
-                    segment = tts_service.convert_to_speech(request)
-                    segment.item_number = item.item_number
-
-                    # Cache the audio (using article link or title+date fallback)
-                    cache_audio(item.link, voice_name, segment.audio_bytes, item.title, digest_date)
-
-                segments.append(segment)
-                items_processed += 1
-
-            except TTSError as e:
-                logger.error(f"Failed to convert item {item.item_number}: {e}")
-                error_message = f"Failed to convert item {item.item_number}: {e}"
-                # Continue with remaining items
+        # Generate audio for all items in parallel, keeping newsletter order
+        ordered_segments: list[AudioSegment | None] = [None] * total_items
+        with ThreadPoolExecutor(max_workers=min(MAX_TTS_WORKERS, total_items)) as executor:
+            future_to_index = {
+                executor.submit(
+                    _synthesize_item, item, tts_service, config, digest_date, total_items
+                ): index
+                for index, item in enumerate(items)
+            }
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                try:
+                    ordered_segments[index] = future.result()
+                    items_processed += 1
+                except TTSError as e:
+                    item_number = items[index].item_number
+                    logger.error(f"Failed to convert item {item_number}: {e}")
+                    error_message = f"Failed to convert item {item_number}: {e}"
+                    # Continue with remaining items
+
+        segments = [segment for segment in ordered_segments if segment is not None]
 
         # Check if any items were processed
         if items_processed == 0:
@@ -1,38 +1,112 @@
 """ElevenLabs text-to-speech service implementation."""
 
 import logging
+import os
 import subprocess
-import tempfile
-from pathlib import Path
+import threading
 
+import httpx
 from elevenlabs import ElevenLabs
 
 from src.models.audio_models import AudioSegment, ElevenLabsConfig, TTSRequest
 from src.services.audio import ElevenLabsTTSError, TTSValidationError
+from src.services.audio.ffmpeg import FFMPEG_BASE, MAX_TTS_WORKERS
+from src.services.retry import with_retry
 
 logger = logging.getLogger(__name__)
 
 # Default ElevenLabs model
 _DEFAULT_MODEL = "eleven_monolingual_v1"
 
+# Up to MAX_TTS_WORKERS conversions run at once; split the cores between them
+# rather than letting every ffmpeg start one thread per core
+_FFMPEG_THREADS = max(1, (os.cpu_count() or MAX_TTS_WORKERS) // MAX_TTS_WORKERS)
 
-def _mp3_bytes_to_wav(mp3_bytes: bytes) -> bytes:
-    """Convert MP3 bytes to WAV bytes using ffmpeg."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        mp3_path = Path(tmpdir) / "input.mp3"
-        wav_path = Path(tmpdir) / "output.wav"
-        mp3_path.write_bytes(mp3_bytes)
-        try:
-            subprocess.run(
-                ["ffmpeg", "-i", str(mp3_path), "-y", str(wav_path)],
-                check=True,
-                capture_output=True,
+# Immediate resubmissions after a 429 too_many_concurrent_requests before the
+# request is treated like system_busy and backed off
+_CONCURRENCY_RESUBMITS = 3
+
+
+# One HTTP connection pool for every service instance, so repeated
+# conversions reuse kept-alive TLS connections instead of reconnecting
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
+
+def _shared_http_client(keepalive_connections: int) -> httpx.Client:
+    """Return the process-wide httpx client used for ElevenLabs requests.
+
+    Args:
+        keepalive_connections: Idle connections to keep alive (the plan's
+            concurrency limit); only used when the client is first created.
+    """
+    global _http_client
+
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_keepalive_connections=keepalive_connections,
+                    keepalive_expiry=60.0,
+                ),
+                timeout=httpx.Timeout(60.0, connect=5.0),
             )
-            return wav_path.read_bytes()
-        except subprocess.CalledProcessError as e:
-            raise ElevenLabsTTSError(
-                f"Failed to convert MP3 to WAV: {e.stderr.decode(errors='replace')}"
-            ) from e
+        return _http_client
+
+
+class _ElevenLabsBusyError(ElevenLabsTTSError):
+    """ElevenLabs rejected a request with 429; retried with backoff."""
+
+    pass
+
+
+def _rate_limit_status(error: Exception) -> str | None:
+    """Return the 429 status code string from an ElevenLabs API error.
+
+    ElevenLabs distinguishes "too_many_concurrent_requests" (our own plan's
+    concurrency cap) from "system_busy" (server-side load).
+
+    Returns:
+        The detail status for a 429 response, "" if it has none, or None if
+        the error is not a 429.
+    """
+    if getattr(error, "status_code", None) != 429:
+        return None
+    body = getattr(error, "body", None)
+    detail = body.get("detail") if isinstance(body, dict) else None
+    if isinstance(detail, dict):
+        return str(detail.get("status", ""))
+    return ""
+
+
+def _mp3_bytes_to_wav(mp3_bytes: bytes) -> bytes:
+    """Convert MP3 bytes to WAV bytes using ffmpeg.
+
+    The audio is piped through ffmpeg's stdin/stdout, so nothing touches disk.
+    """
+    try:
+        result = subprocess.run(
+            [
+                *FFMPEG_BASE,
+                "-threads",
+                str(_FFMPEG_THREADS),
+                "-f",
+                "mp3",
+                "-i",
+                "pipe:0",
+                "-f",
+                "wav",
+                "pipe:1",
+            ],
+            input=mp3_bytes,
+            check=True,
+            capture_output=True,
+        )
+        return result.stdout
+    except subprocess.CalledProcessError as e:
+        raise ElevenLabsTTSError(
+            f"Failed to convert MP3 to WAV: {e.stderr.decode(errors='replace')}"
+        ) from e
 
 
 class ElevenLabsTTSService:
@@ -40,7 +114,18 @@ class ElevenLabsTTSService:
 
     def __init__(self, config: ElevenLabsConfig) -> None:
         self.config = config
-        self._client = ElevenLabs(api_key=config.api_key)
+        self._client = ElevenLabs(
+            api_key=config.api_key,
+            httpx_client=_shared_http_client(config.max_concurrency),
+        )
+        # Caps in-flight API requests at the plan limit, however many
+        # threads call convert_to_speech
+        self._request_slots = threading.BoundedSemaphore(config.max_concurrency)
+        # Voice ID -> gender; male last so it wins if both IDs are the same
+        self._voice_gender = {
+            config.female_voice_id: "female",
+            config.male_voice_id: "male",
+        }
 
     @property
     def provider_name(self) -> str:
@@ -70,27 +155,43 @@ class ElevenLabsTTSService:
             request.voice_name,
         )
 
-        try:
-            audio_generator = self._client.text_to_speech.convert(
-                text=request.text,
-                voice_id=request.voice_name,
-                model_id=_DEFAULT_MODEL,
-            )
-            mp3_bytes = b"".join(audio_generator)
-        except Exception as e:
-            raise ElevenLabsTTSError(f"ElevenLabs API error: {e}") from e
-
+        mp3_bytes = self._fetch_mp3(request)
         wav_bytes = _mp3_bytes_to_wav(mp3_bytes)
 
-        voice_gender = (
-            "male"
-            if request.voice_name == self.config.male_voice_id
-            else "female"
-        )
-
         return AudioSegment(
             item_number=1,  # Updated by caller
             audio_bytes=wav_bytes,
             voice_name=request.voice_name,
-            voice_gender=voice_gender,
+            voice_gender=self._voice_gender.get(request.voice_name, "female"),
         )
+
+    @with_retry(max_attempts=5, wait_seconds=2.0, retry_exceptions=(_ElevenLabsBusyError,))
+    def _fetch_mp3(self, request: TTSRequest) -> bytes:
+        """Fetch MP3 audio for request from the API.
+
+        A 429 for too many concurrent requests is resubmitted straight away,
+        since another in-flight request finishing frees the slot; repeated
+        ones, and system_busy 429s, are retried with exponential backoff.
+
+        Raises:
+            ElevenLabsTTSError: API failure (after retries for 429s).
+        """
+        for _ in range(_CONCURRENCY_RESUBMITS):
+            try:
+                with self._request_slots:
+                    audio_generator = self._client.text_to_speech.convert(
+                        text=request.text,
+                        voice_id=request.voice_name,
+                        model_id=_DEFAULT_MODEL,
+                    )
+                    return b"".join(audio_generator)
+            except Exception as e:
+                status = _rate_limit_status(e)
+                if status == "too_many_concurrent_requests":
+                    logger.debug("ElevenLabs concurrency limit hit, resubmitting")
+                    continue
+                if status is not None:
+                    raise _ElevenLabsBusyError(f"ElevenLabs API busy: {e}") from e
+                raise ElevenLabsTTSError(f"ElevenLabs API error: {e}") from e
+
+        raise _ElevenLabsBusyError("ElevenLabs concurrency limit still exceeded")
@@ -0,0 +1,10 @@
+"""Shared ffmpeg settings for the audio services."""
+
+# Items converted concurrently. Cache I/O, API calls and WAV encoding overlap;
+# providers that cannot run inference concurrently serialise it internally.
+MAX_TTS_WORKERS = 4
+
+# Leading arguments for every ffmpeg invocation: never read the terminal
+# (ffmpeg runs from worker threads) and only log errors, which keeps the
+# piped stderr small while still carrying the reason for a failure.
+FFMPEG_BASE = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error"]
@@ -1,9 +1,12 @@
 """Generate audio for feed items missing audio files."""
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from src.db.repository import Repository
 from src.db.connection import get_connection
+from src.services.audio.ffmpeg import MAX_TTS_WORKERS
 from src.services.audio.tts_service import get_tts_provider
 from src.models.audio_models import AudioConfig, TTSRequest
 from src.newsletter.sender_names import get_sender_display_name
@@ -13,6 +16,50 @@ logger = logging.getLogger(__name__)
 CACHE_DIR = Path("data/audio_cache")
 
 
+def _generate_item_audio(idx: int, total: int, item, config: AudioConfig, tts_service) -> Path:
+    """Convert one feed item to speech and save it to the audio cache.
+
+    Args:
+        idx: 1-based position of the item (selects the voice)
+        total: Number of items being checked, for progress logging
+        item: FeedItem to convert
+        config: Audio configuration (voice names)
+        tts_service: TTS provider
+
+    Returns:
+        Path of the saved WAV file
+
+    Raises:
+        Exception: Any TTS or I/O failure, reported by the caller
+    """
+    # Get sender display name for attribution
+    sender_email = item.metadata.get("sender", "")
+    sender_name = get_sender_display_name(sender_email) if sender_email else None
+
+    # Generate audio from item title + summary with source attribution
+    if sender_name:
+        text = f"{sender_name} reports that {item.title}. {item.summary or ''}"
+    else:
+        # Fallback for items without sender (e.g., Zotero items)
+        text = f"{item.title}. {item.summary or ''}"
+
+    # Alternate voices (odd = male, even = female)
+    voice_name = config.male_voice if idx % 2 == 1 else config.female_voice
+
+    source_info = f" ({sender_name})" if sender_name else ""
+    logger.info(f"Generating audio {idx}/{total}{source_info}: {item.title[:60]}...")
+
+    request = TTSRequest(text=text, voice_name=voice_name)
+    segment = tts_service.convert_to_speech(request)
+
+    # Save audio file; write-then-rename so readers never see a partial WAV
+    audio_file = CACHE_DIR / f"{item.source_id}.wav"
+    tmp_file = audio_file.with_suffix(".wav.tmp")
+    tmp_file.write_bytes(segment.audio_bytes)
+    os.replace(tmp_file, audio_file)
+    return audio_file
+
+
 def generate_missing_audio_for_feed_items(items=None) -> dict:
     """Generate audio files for feed items that don't have audio yet.
 
@@ -37,46 +84,33 @@ def generate_missing_audio_for_feed_items(items=None) -> dict:
             items = repo.get_feed_items(source_type='newsletter', limit=1000)
 
     logger.info(f"Checking {len(items)} newsletter items for missing audio")
-
-    for idx, item in enumerate(items, 1):
-        audio_file = CACHE_DIR / f"{item.source_id}.wav"
-
-        if audio_file.exists():
-            result["skipped"] += 1
-            continue
-
-        try:
-            # Get sender display name for attribution
-            sender_email = item.metadata.get("sender", "")
-            sender_name = get_sender_display_name(sender_email) if sender_email else None
-
-            # Generate audio from item title + summary with source attribution
-            if sender_name:
-                text = f"{sender_name} reports that {item.title}. {item.summary or ''}"
-            else:
-                # Fallback for items without sender (e.g., Zotero items)
-                text = f"{item.title}. {item.summary or ''}"
-
-            # Alternate voices (odd = male, even = female)
-            voice_name = config.male_voice if idx % 2 == 1 else config.female_voice
-
-            source_info = f" ({sender_name})" if sender_name else ""
-            logger.info(f"Generating audio {idx}/{len(items)}{source_info}: {item.title[:60]}...")
-
-            request = TTSRequest(text=text, voice_name=voice_name)
-            segment = tts_service.convert_to_speech(request)
-
-            # Save audio file
-            CACHE_DIR.mkdir(parents=True, exist_ok=True)
-            audio_file.write_bytes(segment.audio_bytes)
-
-            result["generated"] += 1
-            logger.info(f"✓ Saved {audio_file.name}")
-
-        except Exception as e:
-            error_msg = f"Failed to generate audio for {item.source_id}: {e}"
-            logger.error(error_msg)
-            result["errors"].append(error_msg)
+    if not items:
+        return result
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Items are independent, so convert the missing ones concurrently
+    with ThreadPoolExecutor(max_workers=min(MAX_TTS_WORKERS, len(items))) as executor:
+        future_to_item = {}
+        for idx, item in enumerate(items, 1):
+            if (CACHE_DIR / f"{item.source_id}.wav").exists():
+                result["skipped"] += 1
+                continue
+            future = executor.submit(
+                _generate_item_audio, idx, len(items), item, config, tts_service
+            )
+            future_to_item[future] = item
+
+        for future in as_completed(future_to_item):
+            item = future_to_item[future]
+            try:
+                audio_file = future.result()
+                result["generated"] += 1
+                logger.info(f"✓ Saved {audio_file.name}")
+            except Exception as e:
+                error_msg = f"Failed to generate audio for {item.source_id}: {e}"
+                logger.error(error_msg)
+                result["errors"].append(error_msg)
 
     logger.info(f"Audio generation complete: {result['generated']} generated, {result['skipped']} skipped, {len(result['errors'])} errors")
     return result
@@ -1,11 +1,25 @@
 """Parse newsletter markdown files for text-to-speech conversion."""
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from src.models.audio_models import NewsletterItem
 
+# Formatting patterns, compiled once at import
+_BOLD_STAR_RE = re.compile(r'\*\*(.+?)\*\*')
+_BOLD_UNDERSCORE_RE = re.compile(r'__(.+?)__')
+_ITALIC_STAR_RE = re.compile(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)')
+_ITALIC_UNDERSCORE_RE = re.compile(r'(?<!_)_(?!_)(.+?)(?<!_)_(?!_)')
+_INLINE_CODE_RE = re.compile(r'`(.+?)`')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
 
+# Newsletter structure patterns
+_BOLD_TITLE_RE = re.compile(r'^\*\*(.+?)\*\*\s*$')
+_READ_MORE_RE = re.compile(r'\[Read More\]\(([^\)]+)\)')
+
+
+@lru_cache(maxsize=4096)
 def strip_markdown_formatting(text: str) -> str:
     """
     Remove markdown formatting from text for clean TTS.
@@ -16,25 +30,40 @@ def strip_markdown_formatting(text: str) -> str:
     - Code: `text`
     - Links: [text](url) -> text
 
+    Results are memoized: regenerating a newsletter strips the same titles
+    and summaries again, and the function is pure on its str input.
+
     Args:
         text: Text with markdown formatting
 
     Returns:
         Clean text without markdown formatting
     """
+    # Each pass only runs if its marker character is present at all; the
+    # "in" checks are single C-level scans, so plain prose skips every regex
+    # while the pass order (and therefore the output) stays the same.
+    has_star = "*" in text
+    has_underscore = "_" in text
+
     # Remove bold (** or __)
-    text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-    text = re.sub(r'__(.+?)__', r'\1', text)
+    if has_star:
+        text = _BOLD_STAR_RE.sub(r'\1', text)
+    if has_underscore:
+        text = _BOLD_UNDERSCORE_RE.sub(r'\1', text)
 
     # Remove italic (* or _) - but be careful not to match bold
-    text = re.sub(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)', r'\1', text)
-    text = re.sub(r'(?<!_)_(?!_)(.+?)(?<!_)_(?!_)', r'\1', text)
+    if has_star:
+        text = _ITALIC_STAR_RE.sub(r'\1', text)
+    if has_underscore:
+        text = _ITALIC_UNDERSCORE_RE.sub(r'\1', text)
 
     # Remove inline code
-    text = re.sub(r'`(.+?)`', r'\1', text)
+    if "`" in text:
+        text = _INLINE_CODE_RE.sub(r'\1', text)
 
     # Remove links [text](url) -> text
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+    if "[" in text:
+        text = _LINK_RE.sub(r'\1', text)
 
     return text
 
@@ -59,116 +88,118 @@ def parse_newsletter_items(markdown_path: Path | str) -> list[NewsletterItem]:
     else:
         content = markdown_path
 
-    items = []
-    item_number = 0
+    items: list[NewsletterItem] = []
+
+    # Single pass over the lines. Each "###" header opens a section; a
+    # section's items are either its **Bold** titled articles or, if it has
+    # no bold titles (old format), the whole section as one item. Both
+    # candidates are collected together and resolved when the section ends.
+    section_title = None  # None until the section's title line is seen
+    in_section = False
+    found_bold = False
+    current_item_title = None
+    current_item_lines: list[str] = []
+    current_item_link = None
+    section_lines: list[str] = []
+    section_link = None
+
+    def end_section() -> None:
+        if not in_section or section_title is None:
+            return
+        if found_bold:
+            # Save the last item in this section
+            if current_item_title and current_item_lines:
+                _append_item(items, current_item_title, current_item_lines, current_item_link)
+        else:
+            # No bold titles found, treat the whole section as one item
+            _append_item(items, section_title, section_lines, section_link)
+
+    # The first line can never start a section (headers follow a newline)
+    for line in content.split("\n")[1:]:
+        if line.startswith("###"):
+            end_section()
+            in_section = True
+            section_title = line[3:].strip() or None
+            found_bold = False
+            current_item_title = None
+            current_item_lines = []
+            current_item_link = None
+            section_lines = []
+            section_link = None
+            continue
+
+        if not in_section:
+            continue  # Text before the first ### header
 
-    # Split by ### headers (category or article titles)
-    sections = content.split("\n###")
+        stripped = line.strip()
 
-    for section in sections[1:]:  # Skip first section before first ###
-        lines = section.strip().split("\n")
-        if not lines or not lines[0].strip():
+        if section_title is None:
+            # Header had no text: the first non-blank line is the title
+            if stripped:
+                section_title = stripped
             continue
 
-        section_title = lines[0].strip()
-
-        # Check if this section contains **Bold** article titles
-        # (new format where ### is a category and ** marks article titles)
-        bold_pattern = re.compile(r'^\*\*(.+?)\*\*\s*$')
-        link_pattern = re.compile(r'\[Read More\]\(([^\)]+)\)')
-        current_item_title = None
-        current_item_lines = []
-        current_item_link = None
-
-        for line in lines[1:]:
-            stripped = line.strip()
-
-            # Extract link if present (for cache stability)
-            link_match = link_pattern.search(stripped)
-            if link_match:
-                current_item_link = link_match.group(1)
-                continue  # Skip this line
-
-            # Skip empty lines, metadata, separators
-            if not stripped or stripped.startswith("*Date:"):
-                continue
-            if stripped == "---" or stripped.startswith("##"):
-                continue
-
-            # Check if this line is a bold title (new article starts)
-            bold_match = bold_pattern.match(stripped)
-            if bold_match:
-                # Save previous item if exists
-                if current_item_title and current_item_lines:
-                    content_text = "\n".join(current_item_lines).strip()
-                    if content_text:
-                        clean_content = strip_markdown_formatting(content_text)
-                        clean_title = strip_markdown_formatting(current_item_title)
-                        item_number += 1
-                        items.append(
-                            NewsletterItem(
-                                title=clean_title,
-                                content=clean_content,
-                                item_number=item_number,
-                                link=current_item_link,
-                            )
-                        )
-
-                # Start new item
-                current_item_title = bold_match.group(1)
-                current_item_lines = []
-                current_item_link = None
-            else:
-                # Add content to current item
-                current_item_lines.append(line)
-
-        # Save the last item in this section
-        if current_item_title and current_item_lines:
-            content_text = "\n".join(current_item_lines).strip()
-            if content_text:
-                clean_content = strip_markdown_formatting(content_text)
-                clean_title = strip_markdown_formatting(current_item_title)
-                item_number += 1
-                items.append(
-                    NewsletterItem(
-                        title=clean_title,
-                        content=clean_content,
-                        item_number=item_number,
-                        link=current_item_link,
-                    )
-                )
-
-        # If no bold titles found, treat the whole section as one item (old format)
-        if not any(bold_pattern.match(line.strip()) for line in lines[1:]):
-            content_lines = []
-            item_link = None
-            for line in lines[1:]:
-                stripped = line.strip()
-
-                # Extract link if present
-                link_match = link_pattern.search(stripped)
-                if link_match:
-                    item_link = link_match.group(1)
-                    continue
-
-                if stripped.startswith("*Date:"):
-                    continue
-                if stripped == "---" or stripped.startswith("##"):
-                    continue
-                content_lines.append(line)
-
-            content_text = "\n".join(content_lines).strip()
-            if content_text:
-                clean_content = strip_markdown_formatting(content_text)
-                clean_title = strip_markdown_formatting(section_title)
-                item_number += 1
-                items.append(
-                    NewsletterItem(
-                        title=clean_title,
-                        content=clean_content,
-                        item_number=item_number,
-                        link=item_link,
-                    )
-                )
+        # Check if this line is a bold title (new article starts). Only
+        # lines opening with "**" can match, so others skip the regex.
+        bold_match = stripped.startswith("**") and _BOLD_TITLE_RE.match(stripped)
+        if bold_match:
+            found_bold = True
+
+        # Extract link if present (for cache stability)
+        link_match = "[Read More](" in stripped and _READ_MORE_RE.search(stripped)
+        if link_match:
+            current_item_link = link_match.group(1)
+            section_link = link_match.group(1)
+            continue  # Skip this line
+
+        # Skip metadata and separators
+        if stripped.startswith("*Date:"):
+            continue
+        if stripped == "---" or stripped.startswith("##"):
+            continue
+
+        # Whole-section (old format) content keeps blank lines
+        section_lines.append(line)
+        if not stripped:
+            continue
+
+        if bold_match:
+            # Save previous item if exists
+            if current_item_title and current_item_lines:
+                _append_item(items, current_item_title, current_item_lines, current_item_link)
+
+            # Start new item
+            current_item_title = bold_match.group(1)
+            current_item_lines = []
+            current_item_link = None
+        else:
+            # Add content to current item
+            current_item_lines.append(line)
+
+    end_section()
 
     return items
+
+
+def _append_item(
+    items: list[NewsletterItem], title: str, lines: list[str], link: str | None
+) -> None:
+    """
+    Append a cleaned NewsletterItem built from collected lines, if non-empty.
+
+    Args:
+        items: Items parsed so far; the new item is numbered after them
+        title: Item title (markdown)
+        lines: Content lines (markdown)
+        link: Article URL, if any
+    """
+    content_text = "\n".join(lines).strip()
+    if content_text:
+        items.append(
+            NewsletterItem(
+                title=strip_markdown_formatting(title),
+                content=strip_markdown_formatting(content_text),
+                item_number=len(items) + 1,
+                link=link,
+            )
+        )
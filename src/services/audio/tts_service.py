@@ -1,7 +1,11 @@
 """Kokoro text-to-speech service and provider factory."""
 
+import contextlib
+import functools
 import io
 import logging
+import threading
+from typing import Any
 
 from src.models.audio_models import AudioConfig, AudioSegment, ElevenLabsConfig, TTSRequest
 from src.services.audio import (
@@ -13,6 +17,29 @@ from src.services.audio import (
 
 logger = logging.getLogger(__name__)
 
+# Guards _load_pipeline so concurrent service construction loads weights once
+_pipeline_load_lock = threading.Lock()
+
+# (pipeline id, voice) pairs already run once on the GPU; see _warm_up
+_warmed_up: set[tuple[int, str]] = set()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pipeline(pipeline_cls: Any, device: str) -> tuple[Any, threading.Lock]:
+    """Build a Kokoro pipeline once per process and device.
+
+    A KokoroTTSService is created for every briefing; reusing the pipeline
+    skips reading and moving the model weights to the device each time.
+
+    Args:
+        pipeline_cls: kokoro.KPipeline
+        device: Torch device name ("cuda" or "cpu")
+
+    Returns:
+        Tuple of (pipeline, lock serialising inference on it)
+    """
+    return pipeline_cls(lang_code="b", device=device), threading.Lock()
+
 
 class KokoroTTSService:
     """Kokoro text-to-speech service implementation (local GPU)."""
@@ -31,10 +58,30 @@ class KokoroTTSService:
 
         self.config = config
         self._sf = sf
+        # Voice name -> gender; male last so it wins if both names are the same
+        self._voice_gender = {config.female_voice: "female", config.male_voice: "male"}
+        # Inference precision context; reduced precision only on GPU
+        self._autocast = contextlib.nullcontext
+        self._reduced_precision = False
         try:
             import torch
             device = "cuda" if torch.cuda.is_available() else "cpu"
-            self._pipeline = KPipeline(lang_code="b", device=device)
+            # The pipeline is shared across services and audio worker threads;
+            # run one inference at a time (torch already parallelises within a call)
+            with _pipeline_load_lock:
+                self._pipeline, self._lock = _load_pipeline(KPipeline, device)
+            if device == "cuda":
+                # Tensor cores run half precision at twice the FP32 rate;
+                # bfloat16 where supported, as it keeps FP32's range
+                dtype = (
+                    torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                )
+                self._autocast = lambda: torch.autocast(device_type="cuda", dtype=dtype)
+                self._reduced_precision = True
+                # Let cuDNN pick the fastest kernels and matmuls use TF32
+                torch.backends.cudnn.benchmark = True
+                torch.backends.cuda.matmul.allow_tf32 = True
+                self._warm_up()
             logger.info("Kokoro TTS pipeline initialized (British English, device=%s)", device)
         except OSError as e:
             if "en_core_web_sm" in str(e):
@@ -51,6 +98,23 @@ class KokoroTTSService:
             logger.error("Failed to initialize Kokoro pipeline: %s", e)
             raise TTSGenerationError(f"Pipeline initialization failed: {e}") from e
 
+    def _warm_up(self) -> None:
+        """Run a throwaway synthesis per configured voice.
+
+        The first GPU inference pays for CUDA context setup, kernel selection
+        and loading the voice pack, adding seconds to the first real item.
+        Done once per pipeline and voice.
+        """
+        for voice in (self.config.male_voice, self.config.female_voice):
+            key = (id(self._pipeline), voice)
+            with _pipeline_load_lock:
+                if key in _warmed_up:
+                    continue
+                _warmed_up.add(key)
+            with self._lock, self._autocast():
+                for _ in self._pipeline("Warmup.", voice=voice):
+                    pass
+
     @property
     def provider_name(self) -> str:
         return "Kokoro"
@@ -68,8 +132,6 @@ class KokoroTTSService:
             TTSGenerationError: Audio generation failed
             TTSValidationError: Invalid request parameters
         """
-        import numpy as np
-
         try:
             if not (1 <= len(request.text) <= 5000):
                 raise TTSValidationError(
@@ -81,30 +143,33 @@ class KokoroTTSService:
                 len(request.text),
                 request.voice_name,
             )
-            generator = self._pipeline(request.text, voice=request.voice_name)
-
-            audio_chunks = []
-            for _graphemes, _phonemes, audio in generator:
-                audio_chunks.append(audio)
-
-            if not audio_chunks:
-                raise TTSGenerationError("No audio generated from pipeline")
-
-            full_audio = np.concatenate(audio_chunks)
-
+            # Encode each chunk as it is generated rather than collecting
+            # them and concatenating into one more full-length array
             wav_buffer = io.BytesIO()
-            self._sf.write(wav_buffer, full_audio, 24000, format="WAV")
-            audio_bytes = wav_buffer.getvalue()
-
-            voice_gender = (
-                "male" if request.voice_name == self.config.male_voice else "female"
-            )
+            chunk_count = 0
+            with self._lock, self._autocast(), self._sf.SoundFile(
+                wav_buffer,
+                mode="w",
+                samplerate=24000,
+                channels=1,
+                format="WAV",
+                subtype="PCM_16",  # Half the size of Kokoro's float32 samples
+            ) as wav_file:
+                generator = self._pipeline(request.text, voice=request.voice_name)
+                for _graphemes, _phonemes, audio in generator:
+                    if self._reduced_precision:
+                        audio = audio.float()  # numpy can't read bfloat16
+                    wav_file.write(audio)
+                    chunk_count += 1
+
+            if not chunk_count:
+                raise TTSGenerationError("No audio generated from pipeline")
 
             return AudioSegment(
                 item_number=1,  # Updated by caller
-                audio_bytes=audio_bytes,
+                audio_bytes=wav_buffer.getvalue(),
                 voice_name=request.voice_name,
-                voice_gender=voice_gender,
+                voice_gender=self._voice_gender.get(request.voice_name, "female"),
             )
 
         except TTSValidationError:
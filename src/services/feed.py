@@ -4,14 +4,36 @@ Aggregates, sorts, and paginates feed items from multiple sources.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Optional, Protocol
 
+from src.db.connection import transaction
 from src.db.repository import Repository
 from src.models.feed_item import FeedItem
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on sources fetched at once by FeedService.refresh_all
+_MAX_REFRESH_WORKERS = 5
+
+
+def _newest_first(items: list[FeedItem]) -> list[FeedItem]:
+    """Return items ordered by date descending.
+
+    Repository queries already ORDER BY item_date DESC, so this is normally a
+    single linear check; the sort only runs if that order was not honoured.
+
+    Args:
+        items: Feed items as returned by the repository
+
+    Returns:
+        The same list if already newest first, otherwise a sorted copy
+    """
+    if all(a.date >= b.date for a, b in zip(items, items[1:])):
+        return items
+    return sorted(items, key=lambda x: x.date, reverse=True)
+
 
 class FeedSource(Protocol):
     """Protocol for feed source implementations."""
@@ -79,8 +101,8 @@ class FeedService:
                 days=days,
             )
 
-        # Ensure sorted by date descending (in case DB doesn't guarantee order)
-        return sorted(items, key=lambda x: x.date, reverse=True)
+        # Repository returns newest first; only re-sort if that was not honoured
+        return _newest_first(items)
 
     def get_feed_count(
         self,
@@ -96,15 +118,7 @@ class FeedService:
         Returns:
             Total number of matching items
         """
-        # For now, retrieve all items and count
-        # Could be optimized with a COUNT query in repository
-        items = self._repository.get_feed_items(
-            source_type=source_type,
-            limit=10000,  # High limit to get all
-            offset=0,
-            days=days,
-        )
-        return len(items)
+        return self._repository.count_feed_items(source_type=source_type, days=days)
 
     @property
     def sources(self) -> dict[str, FeedSource]:
@@ -145,19 +159,26 @@ class FeedService:
         all_items: list[FeedItem] = []
         any_success = False
 
-        for source_type, source in self._sources.items():
+        # Sources are independent network fetches, so run them concurrently;
+        # results are still collected in registration order
+        max_workers = min(_MAX_REFRESH_WORKERS, len(self._sources))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                source_type: executor.submit(self._fetch_source, source_type, source)
+                for source_type, source in self._sources.items()
+            }
+
+        for source_type, future in futures.items():
             source_result: dict[str, Any] = {
                 "items_fetched": 0,
                 "error": None,
             }
 
             try:
-                logger.info(f"Refreshing source: {source_type}")
-                items = source.fetch_items()
+                items = future.result()
                 source_result["items_fetched"] = len(items)
                 all_items.extend(items)
                 any_success = True
-                logger.info(f"Fetched {len(items)} items from {source_type}")
             except Exception as e:
                 source_result["error"] = str(e)
                 logger.error(f"Error refreshing {source_type}: {e}")
@@ -167,7 +188,9 @@ class FeedService:
         # Save all items to repository
         if all_items:
             try:
-                self._repository.save_feed_items_batch(all_items)
+                # Feed rows are re-fetchable; don't wait on the WAL flush
+                with transaction(durable=False):
+                    self._repository.save_feed_items_batch(all_items)
                 logger.info(f"Saved {len(all_items)} items to repository")
             except Exception as e:
                 logger.error(f"Error saving items to repository: {e}")
@@ -180,6 +203,22 @@ class FeedService:
         result["total_items"] = len(all_items)
         return result
 
+    @staticmethod
+    def _fetch_source(source_type: str, source: FeedSource) -> list[FeedItem]:
+        """Fetch items from one source (runs on a refresh worker thread).
+
+        Args:
+            source_type: Source identifier, for logging
+            source: Source to fetch from
+
+        Returns:
+            Items fetched from the source
+        """
+        logger.info(f"Refreshing source: {source_type}")
+        items = source.fetch_items()
+        logger.info(f"Fetched {len(items)} items from {source_type}")
+        return items
+
     def filter_items(
         self,
         source_type: Optional[str] = None,
@@ -200,24 +239,17 @@ class FeedService:
         Returns:
             List of FeedItem objects matching the criteria
         """
-        # Get all items from repository (with source filter if provided)
+        # Date range and pagination are applied by the database
         items = self._repository.get_feed_items(
             source_type=source_type,
-            limit=10000,  # Get all for filtering
-            offset=0,
+            limit=limit,
+            offset=offset,
+            start_date=start_date,
+            end_date=end_date,
         )
 
-        # Apply date filters in memory
-        if start_date:
-            items = [item for item in items if item.date >= start_date]
-        if end_date:
-            items = [item for item in items if item.date <= end_date]
-
-        # Sort by date descending
-        items = sorted(items, key=lambda x: x.date, reverse=True)
-
-        # Apply pagination
-        return items[offset:offset + limit]
+        # Repository returns newest first; only re-sort if that was not honoured
+        return _newest_first(items)
 
     def search_items(
         self,
@@ -247,28 +279,13 @@ class FeedService:
                 offset=offset,
             )
 
-        # Get all items from repository
-        items = self._repository.get_feed_items(
+        # Search in title and summary (case-insensitive), in the database
+        items = self._repository.search_feed_items(
+            query=query,
             source_type=source_type,
-            limit=10000,  # Get all for searching
-            offset=0,
+            limit=limit,
+            offset=offset,
         )
 
-        # Search in title and summary (case-insensitive)
-        query_lower = query.lower()
-        matching_items = []
-
-        for item in items:
-            title_match = query_lower in item.title.lower()
-            summary_match = (
-                query_lower in (item.summary or "").lower() if item.summary else False
-            )
-
-            if title_match or summary_match:
-                matching_items.append(item)
-
-        # Sort by date descending
-        matching_items = sorted(matching_items, key=lambda x: x.date, reverse=True)
-
-        # Apply pagination
-        return matching_items[offset:offset + limit]
+        # Repository returns newest first; only re-sort if that was not honoured
+        return _newest_first(items)
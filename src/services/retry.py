@@ -5,27 +5,67 @@ Uses tenacity library for robust retry handling.
 """
 
 import logging
+import re
 from functools import wraps
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, Optional, TypeVar
 
+import httpx
 from tenacity import (
     retry,
+    retry_if_exception,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
     wait_fixed,
+    wait_random,
 )
 
 logger = logging.getLogger(__name__)
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# HTTP statuses worth retrying: rate limited or a transient server failure
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Network failures: the builtins, plus httpx's transport errors (connect,
+# read, timeout...), which do not subclass them. google-genai and
+# ElevenLabs both talk HTTP through httpx.
+_NETWORK_ERRORS = (ConnectionError, TimeoutError, httpx.TransportError)
+
+# Rate-limit markers in an error message; 429 only as a whole word, so IDs
+# or token counts containing those digits do not match
+_RATE_LIMIT_MESSAGE = re.compile(r"\b429\b|RESOURCE_EXHAUSTED")
+
+
+def _is_retryable_error(error: BaseException) -> bool:
+    """Return True if error is a rate limit or transient failure.
+
+    Recognises network errors, exceptions carrying an HTTP status (as
+    ``status_code`` or ``code``, depending on the client library), and
+    messages reporting 429 / RESOURCE_EXHAUSTED. Validation, auth and
+    programming errors are not retried.
+
+    Args:
+        error: Exception raised by the wrapped call
+
+    Returns:
+        True if the call should be retried
+    """
+    if isinstance(error, _NETWORK_ERRORS):
+        return True
+    for attr in ("status_code", "code"):
+        status = getattr(error, attr, None)
+        if isinstance(status, int):
+            return status in _RETRYABLE_STATUS_CODES
+    return _RATE_LIMIT_MESSAGE.search(str(error)) is not None
+
 
 def with_retry(
     max_attempts: int = 3,
     wait_seconds: float = 1.0,
     exponential: bool = True,
     retry_exceptions: tuple[type[Exception], ...] = (Exception,),
+    retry_if: Optional[Callable[[BaseException], bool]] = None,
 ) -> Callable[[F], F]:
     """Decorator for retrying functions with exponential backoff.
 
@@ -34,6 +74,8 @@ def with_retry(
         wait_seconds: Base wait time between retries (in seconds)
         exponential: Whether to use exponential backoff
         retry_exceptions: Tuple of exception types to retry on
+        retry_if: Predicate deciding whether an exception is retried
+            (optional, overrides retry_exceptions)
 
     Returns:
         Decorated function with retry logic
@@ -46,18 +88,25 @@ def with_retry(
 
     def decorator(func: F) -> F:
         if exponential:
+            # Jitter spreads out callers that failed together (e.g. parallel
+            # workers hitting the same rate limit) so they don't retry in step
             wait_strategy = wait_exponential(
                 multiplier=wait_seconds,
                 min=wait_seconds,
                 max=wait_seconds * 10,
-            )
+            ) + wait_random(0, wait_seconds)
         else:
             wait_strategy = wait_fixed(wait_seconds)
 
+        if retry_if is not None:
+            retry_strategy = retry_if_exception(retry_if)
+        else:
+            retry_strategy = retry_if_exception_type(retry_exceptions)
+
         @retry(
             stop=stop_after_attempt(max_attempts),
             wait=wait_strategy,
-            retry=retry_if_exception_type(retry_exceptions),
+            retry=retry_strategy,
             reraise=True,
         )
         @wraps(func)
@@ -82,7 +131,9 @@ def retry_on_rate_limit(
     """Decorator specifically for rate-limited APIs.
 
     Uses exponential backoff optimized for rate limiting scenarios.
-    Handles 429 errors and RESOURCE_EXHAUSTED responses.
+    Retries 429 / RESOURCE_EXHAUSTED responses, 5xx server errors and
+    network failures; anything else fails immediately (see
+    _is_retryable_error).
 
     Args:
         max_attempts: Maximum number of retry attempts
@@ -95,5 +146,5 @@ def retry_on_rate_limit(
         max_attempts=max_attempts,
         wait_seconds=base_wait,
         exponential=True,
-        retry_exceptions=(Exception,),  # Catch all for now, can be refined
+        retry_if=_is_retryable_error,
     )
@@ -9,9 +9,7 @@ Example usage:
     # Register a source class
     @source_registry.register
     class MySource(FeedSource):
-        @property
-        def source_type(self) -> str:
-            return "my_source"
+        source_type = "my_source"
 
         def fetch_items(self) -> list[FeedItem]:
             return [...]
@@ -49,12 +47,14 @@ class SourceRegistry:
         Can be used as a decorator or called directly.
 
         Args:
-            source_class: A class that implements FeedSource protocol
+            source_class: A class that implements FeedSource protocol,
+                with source_type declared as a class attribute
 
         Returns:
             The source class (for decorator usage)
 
         Raises:
+            TypeError: If source_class has no string source_type attribute
             ValueError: If source_type is already registered
 
         Example:
@@ -65,17 +65,11 @@ class SourceRegistry:
             # Or:
             source_registry.register(MySource)
         """
-        # Create a temporary instance to get source_type
-        # For classes with required __init__ args, use a class attribute
-        if hasattr(source_class, "_source_type"):
-            source_type = source_class._source_type
-        else:
-            # Try to get from class method if available
-            try:
-                source_type = source_class.source_type.fget(None)  # type: ignore
-            except (TypeError, AttributeError):
-                # Use class name as fallback
-                source_type = source_class.__name__.lower().replace("source", "")
+        source_type = getattr(source_class, "source_type", None)
+        if not isinstance(source_type, str):
+            raise TypeError(
+                f"{source_class.__name__} must declare source_type as a class attribute"
+            )
 
         if source_type in self._sources:
             raise ValueError(f"Source type '{source_type}' is already registered")
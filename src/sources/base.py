@@ -12,9 +12,7 @@ Example:
     from src.models.feed_item import FeedItem
 
     class MySource(FeedSource):
-        @property
-        def source_type(self) -> str:
-            return "my_source"
+        source_type = "my_source"
 
         def fetch_items(self) -> list[FeedItem]:
             # Fetch items from your data source
@@ -42,7 +40,9 @@ class FeedSource(Protocol):
 
     Attributes:
         source_type: Unique identifier for this source type (e.g., "zotero").
-            Must be unique across all registered sources.
+            Must be unique across all registered sources. Declare it as a
+            class attribute so SourceRegistry.register can read it without
+            an instance.
 
     Methods:
         fetch_items: Retrieve items from the source and return as FeedItems.
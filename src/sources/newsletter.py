@@ -4,10 +4,12 @@ Wraps existing src/newsletter/ functionality to implement FeedSource protocol.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from src.models.feed_item import FeedItem
 from src.models.source import NewsletterConfig
+from src.db.connection import transaction
 from src.db.repository import Repository
 from src.newsletter.email_collector import (
     collect_newsletter_emails,
@@ -17,6 +19,25 @@ from src.newsletter.email_collector import (
 
 logger = logging.getLogger(__name__)
 
+# Single background worker for feed item audio; overlapping refreshes queue up
+# rather than synthesizing the same items twice
+_AUDIO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="newsletter-audio")
+
+
+def _generate_audio(items: list[FeedItem]) -> None:
+    """Generate missing audio for items, logging failures instead of raising.
+
+    Args:
+        items: Feed items that should have audio
+    """
+    from src.services.audio.generate_missing_audio import generate_missing_audio_for_feed_items
+
+    try:
+        audio_result = generate_missing_audio_for_feed_items(items=items)
+        logger.info(f"Generated audio for {audio_result['generated']} items (skipped {audio_result['skipped']} existing)")
+    except Exception as e:
+        logger.error(f"Background audio generation failed: {e}")
+
 
 class NewsletterSource:
     """Newsletter feed source implementing FeedSource protocol.
@@ -56,8 +77,8 @@ class NewsletterSource:
         # Initialize repository
         repo = Repository()
 
-        # Track items before pipeline starts (to identify new ones)
-        items_before = {item.id for item in repo.get_feed_items(source_type="newsletter", limit=1000)}
+        # Track items before pipeline starts (to identify new ones); IDs only
+        items_before = set(repo.get_feed_item_ids(source_type="newsletter", limit=1000))
 
         # Step 1: Collect emails from Gmail
         logger.info(f"Step 1: Collecting emails from Gmail (days_lookback={self._config.days_lookback})")
@@ -97,7 +118,6 @@ class NewsletterSource:
         logger.info("Step 3: Parsing newsletters with LLM")
         parse_result = parse_newsletters(
             markdown_dir="data/markdown",
-            parsed_dir="data/parsed",
             config_path="config/senders.json",
             emails_dir="data/emails",
         )
@@ -108,40 +128,123 @@ class NewsletterSource:
 
         logger.info(f"Parsed {parse_result['emails_parsed']} newsletters")
 
+        # Read the lookback window once; the exclusion and dedup steps keep
+        # this list in step with their writes instead of re-reading it
+        all_items = repo.get_feed_items(source_type="newsletter", limit=1000, days=self._config.days_lookback)
+
+        # Loaded once and shared by the exclusion and dedup steps
+        newsletter_cfg = self._load_newsletter_config()
+
         # Step 3: Apply topic exclusions before clustering
+        all_items = self._exclude_topics(repo, all_items, newsletter_cfg)
+
+        # Step 3.5: Deduplicate newly-added items before audio generation
+        all_items = self._deduplicate(repo, all_items, newsletter_cfg)
+
+        # Step 4: Generate audio only for items that survived deduplication.
+        # TTS is slow and the items are already saved, so it runs in the
+        # background rather than holding up the refresh
+        logger.info("Step 4: Generating audio for items in the background")
+        _AUDIO_POOL.submit(_generate_audio, all_items)
+
+        # Step 5: Return only NEW items within lookback window
+        new_items = [item for item in all_items if item.id not in items_before]
+
+        logger.info(f"Returning {len(new_items)} new newsletter items (out of {len(all_items)} total)")
+        return new_items
+
+    def _load_newsletter_config(self):
+        """Load the newsletter config, or None if it cannot be read."""
+        from src.newsletter.config import load_config as load_newsletter_config
+
+        try:
+            return load_newsletter_config()
+        except Exception as e:
+            logger.error(f"Failed to load newsletter config: {e}")
+            return None
+
+    def _exclude_topics(
+        self, repo: Repository, all_items: list[FeedItem], newsletter_cfg
+    ) -> list[FeedItem]:
+        """Delete items matching an excluded topic.
+
+        Args:
+            repo: Repository holding the items
+            all_items: Newsletter items in the lookback window
+            newsletter_cfg: Newsletter config, or None if unavailable
+
+        Returns:
+            The items that were kept
+        """
+        if newsletter_cfg is None:
+            return all_items
         try:
-            from src.newsletter.config import load_config as load_newsletter_config
-            newsletter_cfg = load_newsletter_config()
             excluded_topics = newsletter_cfg.excluded_topics
             if excluded_topics:
-                candidates = repo.get_feed_items(source_type="newsletter", limit=1000, days=self._config.days_lookback)
-                excluded_count = 0
-                for item in candidates:
+                kept = []
+                excluded = []
+                # Lowercase the topics once, not once per candidate item, and
+                # drop repeats (the config allows duplicate entries)
+                excluded_lower = list(dict.fromkeys(topic.lower() for topic in excluded_topics))
+                for item in all_items:
                     text = f"{item.title} {item.summary or ''}".lower()
-                    if any(topic.lower() in text for topic in excluded_topics):
-                        repo.delete_feed_item(item.id)
-                        excluded_count += 1
-                        logger.info(f"Excluded item: {item.title[:60]}")
-                if excluded_count:
-                    logger.info(f"Step 3: Excluded {excluded_count} items matching {excluded_topics}")
+                    if any(topic in text for topic in excluded_lower):
+                        excluded.append(item)
+                    else:
+                        kept.append(item)
+                repo.delete_feed_items([item.id for item in excluded])
+                for item in excluded:
+                    logger.info(f"Excluded item: {item.title[:60]}")
+                if excluded:
+                    logger.info(f"Step 3: Excluded {len(excluded)} items matching {excluded_topics}")
+                return kept
         except Exception as e:
             logger.error(f"Exclusion step failed: {e}")
+        return all_items
 
-        # Step 3.5: Deduplicate newly-added items before audio generation
+    def _deduplicate(
+        self, repo: Repository, all_items: list[FeedItem], newsletter_cfg
+    ) -> list[FeedItem]:
+        """Drop exact repeats, then merge near-duplicates with the LLM.
+
+        Args:
+            repo: Repository holding the items
+            all_items: Newsletter items left after exclusion, newest first
+            newsletter_cfg: Newsletter config, or None if unavailable
+
+        Returns:
+            The items the database holds afterwards, newest first
+        """
         logger.info("Step 3.5: Starting deduplication")
         try:
+            # Exact repeats (same title up to case and whitespace, same day)
+            # are dropped locally so the LLM only sees items needing judgement
+            unique: dict[tuple[str, str], FeedItem] = {}
+            repeats = []
+            for item in all_items:
+                key = (" ".join(item.title.split()).casefold(), item.date.date().isoformat())
+                if key in unique:
+                    repeats.append(item)
+                else:
+                    unique[key] = item
+            if repeats:
+                repo.delete_feed_items([item.id for item in repeats])
+                all_items = list(unique.values())
+                logger.info(f"Step 3.5: Dropped {len(repeats)} exact duplicate items")
+
             import os
-            import google.genai as genai
             from src.newsletter.deduplicator import deduplicate_items
             from src.newsletter.id_generation import generate_newsletter_id
+            from src.newsletter.parser import create_llm_client
 
             gemini_api_key = os.environ.get("GEMINI_API_KEY")
             if gemini_api_key:
-                llm_client = genai.Client(api_key=gemini_api_key)
-                from src.newsletter.config import load_config as _load_cfg
-                model_name = _load_cfg().models["consolidation"]
+                llm_client = create_llm_client(gemini_api_key)
+                if newsletter_cfg is None:
+                    raise ValueError("newsletter config unavailable")
+                model_name = newsletter_cfg.models["consolidation"]
 
-                all_newsletter_items = repo.get_feed_items(source_type="newsletter", limit=1000, days=self._config.days_lookback)
+                all_newsletter_items = all_items
 
                 if len(all_newsletter_items) > 1:
                     logger.info(f"Step 3.5: Deduplicating {len(all_newsletter_items)} newsletter items")
@@ -157,15 +260,14 @@ class NewsletterSource:
                     ]
                     deduped = deduplicate_items(items_as_dicts, llm_client, model_name)
                     if len(deduped) < len(all_newsletter_items):
-                        for item in all_newsletter_items:
-                            repo.delete_feed_item(item.id)
                         merged = []
+                        now = datetime.now(timezone.utc)
                         for d in deduped:
                             item_id = generate_newsletter_id(d.get("title", ""), d.get("date", ""))
                             try:
-                                item_date = datetime.fromisoformat(d["date"].replace("Z", "+00:00")) if d.get("date") else datetime.now(timezone.utc)
+                                item_date = datetime.fromisoformat(d["date"]) if d.get("date") else now
                             except (ValueError, AttributeError):
-                                item_date = datetime.now(timezone.utc)
+                                item_date = now
                             if item_date.tzinfo is None:
                                 item_date = item_date.replace(tzinfo=timezone.utc)
                             merged.append(FeedItem(
@@ -177,23 +279,20 @@ class NewsletterSource:
                                 summary=d.get("summary") or None,
                                 link=d.get("link"),
                                 metadata={},
-                                fetched_at=datetime.now(timezone.utc),
+                                fetched_at=now,
                             ))
-                        repo.save_feed_items(merged)
+                        # Swap the originals for the merged items atomically
+                        with transaction(durable=False):
+                            repo.delete_feed_items([item.id for item in all_newsletter_items])
+                            repo.save_feed_items(merged)
+                        # Same rows the database now holds: one per ID, newest first
+                        all_items = sorted(
+                            {item.id: item for item in merged}.values(),
+                            key=lambda item: item.date,
+                            reverse=True,
+                        )
                         logger.info(f"Deduplication: {len(all_newsletter_items)} → {len(deduped)} items")
         except Exception as e:
             import traceback
             logger.error(f"Deduplication step failed: {e}\n{traceback.format_exc()}")
-
-        # Step 4: Generate audio only for items that survived deduplication
-        all_items = repo.get_feed_items(source_type="newsletter", limit=1000, days=self._config.days_lookback)
-        logger.info("Step 4: Generating audio for items")
-        from src.services.audio.generate_missing_audio import generate_missing_audio_for_feed_items
-        audio_result = generate_missing_audio_for_feed_items(items=all_items)
-        logger.info(f"Generated audio for {audio_result['generated']} items (skipped {audio_result['skipped']} existing)")
-
-        # Step 5: Return only NEW items within lookback window
-        new_items = [item for item in all_items if item.id not in items_before]
-
-        logger.info(f"Returning {len(new_items)} new newsletter items (out of {len(all_items)} total)")
-        return new_items
+        return all_items
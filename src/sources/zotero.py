@@ -40,20 +40,21 @@ class ZoteroSource:
         # Fetch raw items from Zotero API
         raw_items = fetch_recent_items(self._client, self._config.days_lookback)
 
+        # Filter out attachments and notes (keep only top-level items) first,
+        # so keyword matching doesn't build search text for them
+        top_level_items = [
+            item for item in raw_items
+            if item.get("data", {}).get("itemType") not in ("attachment", "note")
+        ]
+
         # Apply keyword filters if configured
         if self._config.include_keywords or self._config.exclude_keywords:
-            raw_items = filter_by_keywords(
-                raw_items,
+            top_level_items = filter_by_keywords(
+                top_level_items,
                 include=self._config.include_keywords,
                 exclude=self._config.exclude_keywords,
             )
 
-        # Filter out attachments and notes (keep only top-level items)
-        top_level_items = [
-            item for item in raw_items
-            if item.get("data", {}).get("itemType") not in ("attachment", "note")
-        ]
-
         # Convert to FeedItem format
         return [self._to_feed_item(item) for item in top_level_items]
 
@@ -9,6 +9,7 @@ Provides environment variable loading and validation for:
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -19,6 +20,16 @@ from dotenv import load_dotenv
 # =============================================================================
 
 
+@lru_cache(maxsize=1)
+def _ensure_dotenv() -> None:
+    """Load the .env file into the environment once per process.
+
+    See reset_env_cache() to force the file to be read again.
+    """
+    load_dotenv()
+
+
+@lru_cache(maxsize=1)
 def get_database_url() -> str:
     """Get PostgreSQL database URL from environment.
 
@@ -28,7 +39,7 @@ def get_database_url() -> str:
     Raises:
         ValueError: If DATABASE_URL is not set
     """
-    load_dotenv()
+    _ensure_dotenv()
     url = os.getenv("DATABASE_URL", "").strip()
     if not url:
         raise ValueError(
@@ -39,6 +50,7 @@ def get_database_url() -> str:
     return url
 
 
+@lru_cache(maxsize=1)
 def get_encryption_key() -> str:
     """Get encryption key for OAuth token storage.
 
@@ -48,7 +60,7 @@ def get_encryption_key() -> str:
     Raises:
         ValueError: If ENCRYPTION_KEY is not set
     """
-    load_dotenv()
+    _ensure_dotenv()
     key = os.getenv("ENCRYPTION_KEY", "").strip()
     if not key:
         raise ValueError(
@@ -58,6 +70,7 @@ def get_encryption_key() -> str:
     return key
 
 
+@lru_cache(maxsize=1)
 def get_gemini_api_key() -> str:
     """Get Gemini API key from environment.
 
@@ -67,7 +80,7 @@ def get_gemini_api_key() -> str:
     Raises:
         ValueError: If GEMINI_API_KEY is not set
     """
-    load_dotenv()
+    _ensure_dotenv()
     key = os.getenv("GEMINI_API_KEY", "").strip()
     if not key:
         raise ValueError(
@@ -87,11 +100,24 @@ def get_optional_env(key: str, default: Optional[str] = None) -> Optional[str]:
     Returns:
         str or None: The environment variable value or default
     """
-    load_dotenv()
+    _ensure_dotenv()
     value = os.getenv(key, "").strip()
     return value if value else default
 
 
+def reset_env_cache() -> None:
+    """Forget cached .env and environment values so they are read again.
+
+    The fixed-key getters above cache their result for the life of the
+    process; call this after changing the environment (e.g. in tests).
+    get_optional_env always reads the current environment.
+    """
+    _ensure_dotenv.cache_clear()
+    get_database_url.cache_clear()
+    get_encryption_key.cache_clear()
+    get_gemini_api_key.cache_clear()
+
+
 # =============================================================================
 # Legacy Zotero Configuration (preserved for backwards compatibility)
 # =============================================================================
@@ -142,10 +168,9 @@ def load_configuration() -> Configuration:
         ValueError: If required credentials are missing or invalid
     """
     import os
-    from dotenv import load_dotenv
 
     # Load .env file if it exists
-    load_dotenv()
+    _ensure_dotenv()
 
     # Read required credentials from environment
     library_id = os.getenv("ZOTERO_LIBRARY_ID", "").strip()
@@ -5,6 +5,7 @@ Uses Fernet symmetric encryption for secure token storage.
 
 import json
 import os
+from functools import lru_cache
 from typing import Any
 
 from cryptography.fernet import Fernet
@@ -26,6 +27,16 @@ def _get_fernet() -> Fernet:
     if not encryption_key:
         raise ValueError("ENCRYPTION_KEY environment variable is required")
 
+    return _fernet_for_key(encryption_key)
+
+
+@lru_cache(maxsize=4)
+def _fernet_for_key(encryption_key: str) -> Fernet:
+    """Create (once per key) a Fernet cipher from ENCRYPTION_KEY.
+
+    The PBKDF2 derivation is deliberately slow, so it runs once per key
+    rather than on every encrypt/decrypt call.
+    """
     # Derive a proper 32-byte key using PBKDF2
     # Using a static salt since we need deterministic key derivation
     # The ENCRYPTION_KEY provides the entropy
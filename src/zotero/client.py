@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 from pyzotero import zotero
 
@@ -15,6 +16,9 @@ def create_zotero_client(library_id: str, api_key: str) -> zotero.Zotero:
     """
     Create and initialize a Zotero API client.
 
+    Clients are cached per (library_id, api_key), so sources rebuilt on every
+    feed request keep reusing one client and its pooled HTTP connections.
+
     Args:
         library_id: Zotero user/library ID
         api_key: Zotero API key
@@ -27,9 +31,7 @@ def create_zotero_client(library_id: str, api_key: str) -> zotero.Zotero:
         ZoteroConnectionError: If connection to API fails
     """
     try:
-        # Initialize client for user's personal library
-        client = zotero.Zotero(library_id, "user", api_key)
-        return client
+        return _client_for_library(library_id, api_key)
     except Exception as e:
         error_msg = str(e).lower()
         if (
@@ -49,6 +51,12 @@ def create_zotero_client(library_id: str, api_key: str) -> zotero.Zotero:
         raise ZoteroConnectionError(f"Failed to initialize Zotero client: {e}") from e
 
 
+@lru_cache(maxsize=4)
+def _client_for_library(library_id: str, api_key: str) -> zotero.Zotero:
+    """Create (once per library and key) a client for a user's personal library."""
+    return zotero.Zotero(library_id, "user", api_key)
+
+
 def fetch_recent_items(client: zotero.Zotero, days: int) -> list[ZoteroItem]:
     """
     Retrieve library items added within the specified time window.
@@ -46,8 +46,9 @@ def sort_and_limit_items(items: list[ZoteroItem], limit: int = 10) -> list[Zoter
                 # ISO format or full date (YYYY-MM-DD)
                 date_obj = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
             elif date_str.count("-") == 1:
-                # YYYY-MM format
-                date_obj = datetime.strptime(date_str, "%Y-%m")
+                # YYYY-MM format - build directly, strptime is far slower
+                year, month = date_str.split("-")
+                date_obj = datetime(int(year), int(month), 1)
             else:
                 # Just year (YYYY)
                 date_obj = datetime(int(date_str), 1, 1)
@@ -104,65 +105,55 @@ def filter_by_keywords(
     if exclude is None:
         exclude = []
 
-    # Normalize keywords to lowercase for case-insensitive matching
-    include_lower = [kw.lower() for kw in include if kw]
-    exclude_lower = [kw.lower() for kw in exclude if kw]
-
-    def item_matches_keywords(item: ZoteroItem, keywords: list[str]) -> bool:
-        """Check if item matches any of the given keywords."""
-        if not keywords:
-            return False
-
-        def normalize_text(text: str) -> str:
-            """Normalize text for matching: lowercase and replace hyphens/underscores with spaces."""
-            return text.lower().replace("-", " ").replace("_", " ")
-
-        data = item.get("data", {})
-        search_texts = []
-
-        # Search in title
-        title = data.get("title", "")
-        if title:
-            search_texts.append(normalize_text(title))
-
-        # Search in abstract
-        abstract = data.get("abstractNote", "")
-        if abstract:
-            search_texts.append(normalize_text(abstract))
-
-        # Search in tags
-        tags = data.get("tags", [])
-        for tag in tags:
-            tag_name = tag.get("tag", "")
-            if tag_name:
-                search_texts.append(normalize_text(tag_name))
-
-        # Combine all searchable text
-        combined_text = " ".join(search_texts)
-
-        # Check if any keyword matches (substring search)
-        # Normalize keywords too
-        for keyword in keywords:
-            normalized_keyword = normalize_text(keyword)
-            if normalized_keyword in combined_text:
-                return True
-
-        return False
-
-    # First, apply exclusion filter (takes precedence)
-    filtered_items = items
-    if exclude_lower:
-        filtered_items = [
-            item for item in filtered_items
-            if not item_matches_keywords(item, exclude_lower)
-        ]
-
-    # Then, apply inclusion filter (if provided)
-    if include_lower:
-        filtered_items = [
-            item for item in filtered_items
-            if item_matches_keywords(item, include_lower)
-        ]
+    # Normalize keywords once, not once per item
+    include_norm = [_normalize_text(kw) for kw in include if kw]
+    exclude_norm = [_normalize_text(kw) for kw in exclude if kw]
+
+    if not include_norm and not exclude_norm:
+        return items
+
+    # Single pass: build each item's searchable text once and test both lists
+    filtered_items = []
+    for item in items:
+        text = _searchable_text(item)
+
+        # Exclusion takes precedence
+        if any(keyword in text for keyword in exclude_norm):
+            continue
+
+        if include_norm and not any(keyword in text for keyword in include_norm):
+            continue
+
+        filtered_items.append(item)
 
     return filtered_items
 
+
+def _normalize_text(text: str) -> str:
+    """Normalize text for matching: lowercase and replace hyphens/underscores with spaces."""
+    return text.lower().replace("-", " ").replace("_", " ")
+
+
+def _searchable_text(item: ZoteroItem) -> str:
+    """Return an item's normalized title, abstract, and tag names joined by spaces."""
+    data = item.get("data", {})
+    search_texts = []
+
+    # Search in title
+    title = data.get("title", "")
+    if title:
+        search_texts.append(_normalize_text(title))
+
+    # Search in abstract
+    abstract = data.get("abstractNote", "")
+    if abstract:
+        search_texts.append(_normalize_text(abstract))
+
+    # Search in tags
+    for tag in data.get("tags", []):
+        tag_name = tag.get("tag", "")
+        if tag_name:
+            search_texts.append(_normalize_text(tag_name))
+
+    return " ".join(search_texts)
+
@@ -270,3 +270,42 @@ class TestCollectEmails:
         result = collect_emails(mock_creds, sender_emails, processed_ids)
 
         assert result == []
+
+    @patch("src.newsletter.gmail_client.build")
+    def test_collect_emails_keeps_sender_order_across_workers(self, mock_build):
+        """Test senders fetched concurrently are returned in sender order."""
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+        mock_messages = MagicMock()
+        mock_service.users.return_value.messages.return_value = mock_messages
+
+        senders = [f"sender{i}@example.com" for i in range(5)]
+
+        # Each sender has one message whose ID is the sender's index
+        def mock_list(userId, q, maxResults):
+            sender = q.split()[0].removeprefix("from:")
+            return Mock(
+                execute=Mock(return_value={"messages": [{"id": f"msg{senders.index(sender)}"}]})
+            )
+
+        def mock_get(userId, id, format):
+            sender = senders[int(id.removeprefix("msg"))]
+            return Mock(
+                execute=Mock(
+                    return_value={
+                        "id": id,
+                        "payload": {
+                            "headers": [{"name": "From", "value": sender}],
+                            "body": {"data": ""},
+                        },
+                    }
+                )
+            )
+
+        mock_messages.list = mock_list
+        mock_messages.get = mock_get
+
+        result = collect_emails(Mock(spec=Credentials), senders, set())
+
+        assert [email["message_id"] for email in result] == [f"msg{i}" for i in range(5)]
+        assert [email["sender"] for email in result] == senders
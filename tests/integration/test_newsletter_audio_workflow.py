@@ -51,7 +51,8 @@ def test_save_consolidated_digest_triggers_audio(
 
     # Save newsletter
     output_dir = str(tmp_path)
-    file_path = save_consolidated_digest(sample_newsletter_content, output_dir)
+    file_path, audio_future = save_consolidated_digest(sample_newsletter_content, output_dir)
+    audio_future.result(timeout=5)
 
     # Verify markdown was saved
     assert Path(file_path).exists()
@@ -75,7 +76,8 @@ def test_audio_failure_does_not_block_newsletter(
 
     # Save newsletter - should succeed despite audio failure
     output_dir = str(tmp_path)
-    file_path = save_consolidated_digest(sample_newsletter_content, output_dir)
+    file_path, audio_future = save_consolidated_digest(sample_newsletter_content, output_dir)
+    assert audio_future.result(timeout=5) is None
 
     # Verify markdown was still saved
     assert Path(file_path).exists()
@@ -100,11 +102,13 @@ def test_multiple_newsletters_each_get_audio(
     output_dir = str(tmp_path)
 
     # Save first newsletter
-    file_path_1 = save_consolidated_digest(sample_newsletter_content, output_dir)
+    file_path_1, audio_future_1 = save_consolidated_digest(sample_newsletter_content, output_dir)
 
     # Save second newsletter (slightly different content)
     content_2 = sample_newsletter_content.replace("First", "Third")
-    file_path_2 = save_consolidated_digest(content_2, output_dir)
+    file_path_2, audio_future_2 = save_consolidated_digest(content_2, output_dir)
+    audio_future_1.result(timeout=5)
+    audio_future_2.result(timeout=5)
 
     # Verify both markdown files exist
     assert Path(file_path_1).exists()
@@ -6,7 +6,11 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.zotero import AuthenticationError, ZoteroConnectionError
-from src.zotero.client import fetch_recent_items
+from src.zotero.client import (
+    _client_for_library,
+    create_zotero_client,
+    fetch_recent_items,
+)
 
 
 def test_fetch_recent_items_success():
@@ -115,3 +119,19 @@ def test_fetch_recent_items_empty_result():
     call_args = mock_client.items.call_args
     assert call_args.kwargs["sort"] == "dateAdded"
 
+
+
+def test_create_zotero_client_reuses_client_per_library():
+    """Test create_zotero_client() builds one client per library and key."""
+    _client_for_library.cache_clear()
+    with patch(
+        "src.zotero.client.zotero.Zotero", side_effect=lambda *args: MagicMock()
+    ) as mock_zotero:
+        first = create_zotero_client("123", "key")
+        second = create_zotero_client("123", "key")
+        other = create_zotero_client("456", "key")
+
+    assert first is second
+    assert other is not first
+    assert mock_zotero.call_count == 2
+    _client_for_library.cache_clear()
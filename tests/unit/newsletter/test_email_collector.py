@@ -0,0 +1,40 @@
+"""Unit tests for the newsletter email collection pipeline."""
+
+from unittest.mock import MagicMock, patch
+
+from src.newsletter.email_collector import collect_newsletter_emails
+
+
+def test_collect_keeps_batch_when_one_db_write_fails(tmp_path):
+    """Test a failed write rolls back that email only, not the whole batch."""
+    emails = [
+        {"message_id": f"msg{i}", "sender": "news@example.com", "subject": f"Issue {i}"}
+        for i in range(3)
+    ]
+    mock_repo = MagicMock()
+    mock_repo.get_processed_message_ids.return_value = set()
+    mock_repo.track_email_processed.side_effect = [None, RuntimeError("db error"), None]
+
+    mock_pool = MagicMock()
+    mock_conn = MagicMock()
+    mock_pool.getconn.return_value = mock_conn
+    mock_cursor = mock_conn.cursor.return_value.__enter__.return_value
+
+    with patch("src.newsletter.email_collector._get_config_dict",
+               return_value={"senders": {"news@example.com": {}}}), \
+         patch("src.newsletter.email_collector.authenticate_gmail"), \
+         patch("src.newsletter.email_collector.collect_emails", return_value=emails), \
+         patch("src.newsletter.email_collector.Repository", return_value=mock_repo), \
+         patch("src.db.connection._pool", mock_pool):
+        result = collect_newsletter_emails(data_dir=str(tmp_path))
+
+    assert result["success"] is True
+    assert result["emails_collected"] == 2
+    assert len(result["errors"]) == 1
+    assert "msg1" in result["errors"][0]
+
+    statements = [call.args[0] for call in mock_cursor.execute.call_args_list]
+    # The failed email is rolled back to its savepoint; the others are kept
+    assert statements.count("ROLLBACK TO SAVEPOINT batch_item") == 1
+    assert statements.count("RELEASE SAVEPOINT batch_item") == 2
+    mock_conn.commit.assert_called_once()
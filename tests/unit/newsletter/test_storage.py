@@ -0,0 +1,46 @@
+"""Unit tests for newsletter file storage helpers."""
+
+import os
+from datetime import datetime, timezone
+
+from src.newsletter.storage import get_last_digest_timestamp, init_data_directories
+
+
+def test_get_last_digest_timestamp_missing_dir(tmp_path):
+    """Test missing output directory returns None."""
+    assert get_last_digest_timestamp(str(tmp_path / "missing")) is None
+
+
+def test_get_last_digest_timestamp_returns_most_recent(tmp_path):
+    """Test the newest digest filename determines the timestamp."""
+    (tmp_path / "digest_20260203_120000_000001.md").write_text("old")
+    (tmp_path / "digest_20260204_184222_737575.md").write_text("new")
+
+    result = get_last_digest_timestamp(str(tmp_path))
+
+    assert result == datetime(2026, 2, 4, 18, 42, 22, 737575, tzinfo=timezone.utc)
+
+
+def test_get_last_digest_timestamp_sees_new_digest(tmp_path):
+    """Test cached result is invalidated when a digest is added."""
+    (tmp_path / "digest_20260203_120000_000001.md").write_text("old")
+    assert get_last_digest_timestamp(str(tmp_path)).day == 3
+
+    (tmp_path / "digest_20260205_090000_000000.md").write_text("new")
+    # Force a distinct mtime in case the filesystem clock is coarse
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert get_last_digest_timestamp(str(tmp_path)).day == 5
+
+
+def test_init_data_directories_recreates_deleted_subdirectory(tmp_path):
+    """Test a subdirectory removed after the first run is created again."""
+    init_data_directories(str(tmp_path))
+    (tmp_path / "parsed").rmdir()
+
+    init_data_directories(str(tmp_path))
+
+    for name in ("emails", "markdown", "parsed", "output"):
+        assert (tmp_path / name).is_dir()
+    assert not (tmp_path / ".initialized").exists()
@@ -127,6 +127,30 @@ def test_generate_audio_concatenation():
     )
 
 
+def test_single_voice_concatenation_is_loudness_normalized(mocker, tmp_path):
+    """Test loudnorm still runs when every segment uses the same voice."""
+    # Stand in for ffmpeg: write the output file named last on the command line
+    run = mocker.patch(
+        "src.services.audio.audio_generator.subprocess.run",
+        side_effect=lambda args, **kwargs: Path(args[-1]).write_bytes(b"ID3"),
+    )
+    segments = [
+        AudioSegment(
+            item_number=i,
+            audio_bytes=b"RIFF" + b"\x00" * 10,
+            voice_name="bm_george",
+            voice_gender="male",
+        )
+        for i in (1, 2)
+    ]
+
+    concatenate_audio_segments(segments)
+
+    args = run.call_args[0][0]
+    filter_graph = args[args.index("-filter_complex") + 1]
+    assert filter_graph.count("loudnorm=I=-16:TP=-1.5:LRA=11") == 2
+
+
 def test_generate_audio_file_output(sample_markdown, mock_tts_service, mocker):
     """Test that MP3 file is created with correct name."""
     mocker.patch(
@@ -163,3 +187,71 @@ def test_generate_audio_populates_provider_used(sample_markdown, mocker):
     result = generate_audio_for_newsletter(sample_markdown)
 
     assert result.provider_used == "ElevenLabs"
+
+
+def test_generate_audio_keeps_item_order_when_parallel(sample_markdown, mocker):
+    """Segments are concatenated in newsletter order even if items finish out of order."""
+    import threading
+
+    second_item_done = threading.Event()
+
+    def mock_convert(request):
+        if "First item" in request.text:
+            # Finish the first item only after the second one has completed
+            second_item_done.wait(timeout=5)
+        else:
+            second_item_done.set()
+        return AudioSegment(
+            item_number=1,
+            audio_bytes=b"RIFF" + b"\x00" * 50,
+            voice_name=request.voice_name,
+            voice_gender="male",
+        )
+
+    mock_tts = Mock()
+    mock_tts.provider_name = "MockTTS"
+    mock_tts.convert_to_speech.side_effect = mock_convert
+    mocker.patch(
+        "src.services.audio.audio_generator.get_tts_provider", return_value=mock_tts
+    )
+    mocker.patch("src.services.audio.audio_generator.get_cached_audio", return_value=None)
+    mocker.patch("src.services.audio.audio_generator.cache_audio")
+    mock_concat = mocker.patch(
+        "src.services.audio.audio_generator.concatenate_audio_segments",
+        return_value=b"audio",
+    )
+
+    result = generate_audio_for_newsletter(sample_markdown)
+
+    assert result.items_processed == 2
+    segments = mock_concat.call_args[0][0]
+    assert [segment.item_number for segment in segments] == [1, 2]
+
+
+def test_cache_audio_writes_atomically(mocker, tmp_path):
+    """Test cache files appear only once fully written, via rename."""
+    from src.services.audio import audio_generator
+
+    mocker.patch.object(audio_generator, "CACHE_DIR", tmp_path)
+    replace = mocker.spy(audio_generator.os, "replace")
+    audio = b"RIFF" + b"\x01" * 10
+
+    cache_file = audio_generator.cache_audio("https://example.com/a", "bm_george", audio)
+
+    replace.assert_called_once()
+    assert replace.call_args[0][1] == cache_file
+    assert list(tmp_path.glob("*.tmp")) == []
+    assert audio_generator.get_cached_audio("https://example.com/a", "bm_george") == audio
+
+
+def test_content_hash_falls_back_to_spoken_text():
+    """Test items without link or date are cached by their text, not randomly."""
+    from src.services.audio.audio_generator import get_content_hash
+
+    first = get_content_hash(None, "bm_george", "Title", None, text="Same words")
+    again = get_content_hash(None, "bm_george", "Title", None, text="Same words")
+    other = get_content_hash(None, "bm_george", "Title", None, text="Other words")
+
+    assert first == again
+    assert first != other
+    assert first != get_content_hash(None, "bf_emma", "Title", None, text="Same words")
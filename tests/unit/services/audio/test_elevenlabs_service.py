@@ -79,6 +79,37 @@ def test_elevenlabs_convert_female_voice(
     assert result.voice_gender == "female"
 
 
+def test_elevenlabs_resubmits_on_concurrency_429(
+    mocker, elevenlabs_config: ElevenLabsConfig, sample_mp3_bytes: bytes
+) -> None:
+    """A too_many_concurrent_requests 429 is resubmitted without backoff."""
+
+    class FakeApiError(Exception):
+        status_code = 429
+        body = {"detail": {"status": "too_many_concurrent_requests"}}
+
+    mock_client = mocker.MagicMock()
+    mock_client.text_to_speech.convert.side_effect = [
+        FakeApiError("busy"),
+        iter([sample_mp3_bytes]),
+    ]
+    mocker.patch("src.services.audio.elevenlabs_service.ElevenLabs", return_value=mock_client)
+    mocker.patch(
+        "src.services.audio.elevenlabs_service._mp3_bytes_to_wav",
+        return_value=b"RIFF",
+    )
+    sleep = mocker.patch("tenacity.nap.time.sleep")
+
+    service = ElevenLabsTTSService(config=elevenlabs_config)
+    result = service.convert_to_speech(
+        TTSRequest(text="Hello world", voice_name="voice-male-id")
+    )
+
+    assert result.audio_bytes == b"RIFF"
+    assert mock_client.text_to_speech.convert.call_count == 2
+    sleep.assert_not_called()
+
+
 def test_elevenlabs_config_from_env_raises_without_api_key(monkeypatch) -> None:
     """T018: ElevenLabsConfig.from_env() raises ValueError when ELEVENLABS_API_KEY missing."""
     monkeypatch.delenv("ELEVENLABS_API_KEY", raising=False)
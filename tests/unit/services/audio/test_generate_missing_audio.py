@@ -114,3 +114,22 @@ def test_audio_text_generation_sender_not_configured():
         # Should fallback to no attribution
         assert text == "Test Article. Test summary."
         assert "reports that" not in text
+
+
+def test_generate_item_audio_writes_atomically(mock_feed_items, tmp_path):
+    """Test that item audio is renamed into place with no temp file left behind."""
+    from src.services.audio import generate_missing_audio
+    from src.models.audio_models import AudioConfig
+
+    tts_service = MagicMock()
+    tts_service.convert_to_speech.return_value = MagicMock(audio_bytes=b"RIFFdata")
+    item = mock_feed_items[2]
+
+    with patch.object(generate_missing_audio, "CACHE_DIR", tmp_path):
+        audio_file = generate_missing_audio._generate_item_audio(
+            1, 1, item, AudioConfig(), tts_service
+        )
+
+    assert audio_file == tmp_path / "xyz789.wav"
+    assert audio_file.read_bytes() == b"RIFFdata"
+    assert list(tmp_path.glob("*.tmp")) == []
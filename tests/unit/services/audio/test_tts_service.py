@@ -47,19 +47,29 @@ def _make_kokoro_service(mocker, audio_config, pipeline_mock):
     dummy_kokoro, dummy_soundfile, dummy_torch = _make_kokoro_modules(mocker, pipeline_mock)
     fake_wav = b"RIFF" + b"\x00" * 44
 
-    def fake_sf_write(buf, data, samplerate, format):
-        buf.write(fake_wav)
+    class FakeSoundFile:
+        """Writes fake WAV bytes to the buffer once any audio was written."""
 
-    dummy_soundfile.write = fake_sf_write
+        def __init__(self, buf, mode, samplerate, channels, format, subtype):
+            self.buf = buf
+            self.frames = 0
 
-    # Dummy numpy: concatenate just joins lists; that's enough for our mock
-    dummy_numpy = types.ModuleType("numpy")
-    dummy_numpy.concatenate = lambda chunks: chunks[0] if len(chunks) == 1 else sum(chunks, [])  # type: ignore[attr-defined]
+        def write(self, data):
+            self.frames += len(data)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            if self.frames:
+                self.buf.write(fake_wav)
+
+    dummy_soundfile.SoundFile = FakeSoundFile  # type: ignore[attr-defined]
 
     # Keep patches active for the lifetime of the test (not just during __init__)
     mocker.patch.dict(
         sys.modules,
-        {"kokoro": dummy_kokoro, "soundfile": dummy_soundfile, "numpy": dummy_numpy, "torch": dummy_torch},
+        {"kokoro": dummy_kokoro, "soundfile": dummy_soundfile, "torch": dummy_torch},
     )
     service = KokoroTTSService(config=audio_config)
     return service, dummy_soundfile, fake_wav
@@ -112,6 +122,42 @@ def test_kokoro_service_has_provider_name(mocker, mock_kokoro_pipeline, audio_co
     assert service.provider_name == "Kokoro"
 
 
+def test_kokoro_pipeline_loaded_once_per_process(mocker, mock_kokoro_pipeline, audio_config):
+    """Services created later reuse the already loaded pipeline."""
+    first, _, _ = _make_kokoro_service(mocker, audio_config, mock_kokoro_pipeline)
+    second = KokoroTTSService(config=audio_config)
+
+    assert second._pipeline is first._pipeline
+    assert second._lock is first._lock
+    sys.modules["kokoro"].KPipeline.assert_called_once_with(lang_code="b", device="cpu")
+
+
+def test_kokoro_warms_up_gpu_pipeline_once(mocker, mock_kokoro_pipeline, audio_config):
+    """On CUDA, each configured voice is run once before real requests."""
+    dummy_kokoro, dummy_soundfile, dummy_torch = _make_kokoro_modules(mocker, mock_kokoro_pipeline)
+    dummy_torch.cuda = types.SimpleNamespace(  # type: ignore[attr-defined]
+        is_available=lambda: True, is_bf16_supported=lambda: True
+    )
+    dummy_torch.bfloat16 = "bfloat16"  # type: ignore[attr-defined]
+    dummy_torch.autocast = mocker.MagicMock()  # type: ignore[attr-defined]
+    dummy_torch.backends = types.SimpleNamespace(  # type: ignore[attr-defined]
+        cudnn=types.SimpleNamespace(benchmark=False),
+        cuda=types.SimpleNamespace(matmul=types.SimpleNamespace(allow_tf32=False)),
+    )
+    mocker.patch.dict(
+        sys.modules,
+        {"kokoro": dummy_kokoro, "soundfile": dummy_soundfile, "torch": dummy_torch},
+    )
+
+    KokoroTTSService(config=audio_config)
+    KokoroTTSService(config=audio_config)
+
+    assert mock_kokoro_pipeline.call_count == 2
+    mock_kokoro_pipeline.assert_any_call("Warmup.", voice="bm_george")
+    mock_kokoro_pipeline.assert_any_call("Warmup.", voice="bf_emma")
+    assert dummy_torch.backends.cudnn.benchmark is True
+
+
 # --- Factory tests (T008, T009) ---
 
 def test_get_tts_provider_returns_kokoro_when_available(mocker, audio_config):
@@ -4,10 +4,17 @@ import json
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from src.utils.config import load_config, save_config
+from src.utils.config import (
+    get_database_url,
+    get_optional_env,
+    load_config,
+    reset_env_cache,
+    save_config,
+)
 
 
 class TestLoadConfig:
@@ -249,3 +256,39 @@ class TestSaveConfig:
             with open(config_path) as f:
                 saved_data = json.load(f)
             assert saved_data == config_data
+
+
+class TestEnvGetters:
+    """Tests for the environment variable getters."""
+
+    def test_dotenv_loaded_once_per_process(self, monkeypatch):
+        """Test repeated getter calls read the .env file only once."""
+        monkeypatch.setenv("DAILY_BRIEFING_TEST_VAR", "value")
+        reset_env_cache()
+        with patch("src.utils.config.load_dotenv") as mock_load_dotenv:
+            assert get_optional_env("DAILY_BRIEFING_TEST_VAR") == "value"
+            assert get_optional_env("DAILY_BRIEFING_OTHER_VAR", "x") == "x"
+
+        mock_load_dotenv.assert_called_once()
+        reset_env_cache()
+
+    def test_getters_cached_until_reset(self, monkeypatch):
+        """Test getter values are memoized until reset_env_cache()."""
+        monkeypatch.setenv("DATABASE_URL", "postgresql://first")
+        reset_env_cache()
+        with patch("src.utils.config.load_dotenv"):
+            assert get_database_url() == "postgresql://first"
+            monkeypatch.setenv("DATABASE_URL", "postgresql://second")
+            assert get_database_url() == "postgresql://first"
+
+            reset_env_cache()
+            assert get_database_url() == "postgresql://second"
+        reset_env_cache()
+
+    def test_optional_env_reads_current_environment(self, monkeypatch):
+        """Test get_optional_env sees environment changes without a reset."""
+        monkeypatch.setenv("DAILY_BRIEFING_TEST_VAR", "first")
+        with patch("src.utils.config.load_dotenv"):
+            assert get_optional_env("DAILY_BRIEFING_TEST_VAR") == "first"
+            monkeypatch.setenv("DAILY_BRIEFING_TEST_VAR", "second")
+            assert get_optional_env("DAILY_BRIEFING_TEST_VAR") == "second"
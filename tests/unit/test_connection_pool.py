@@ -120,6 +120,31 @@ class TestConnectionAcquisition:
             # Verify rollback called to clear state
             mock_conn.rollback.assert_called_once()
 
+    def test_nested_get_connection_outside_transaction_is_isolated(self):
+        """Nested blocks outside transaction() must not share a connection.
+
+        Otherwise an inner Repository commit would commit the outer block's
+        pending writes, and an inner failure would leave the shared
+        connection in an aborted transaction.
+        """
+        from src.db.connection import commit, get_connection
+
+        mock_pool = MagicMock()
+        outer_conn = MagicMock()
+        inner_conn = MagicMock()
+        mock_pool.getconn.side_effect = [outer_conn, inner_conn]
+
+        with patch("src.db.connection._pool", mock_pool):
+            with get_connection() as outer:
+                with get_connection() as inner:
+                    assert inner is not outer
+                    commit(inner)
+                mock_pool.putconn.assert_called_once_with(inner_conn)
+
+            inner_conn.commit.assert_called_once()
+            outer_conn.commit.assert_not_called()
+            assert mock_pool.putconn.call_count == 2
+
 
 class TestPoolExhaustion:
     """Test behavior when connection pool is exhausted."""
@@ -166,6 +191,70 @@ class TestPoolExhaustion:
                     assert mock_sleep.call_args_list[1][0][0] == 2
 
 
+class TestTransaction:
+    """Test batching several writes into one commit."""
+
+    def test_transaction_defers_inner_commits(self):
+        """Per-call commits inside transaction() should collapse into one."""
+        from src.db.connection import commit, get_connection, transaction
+
+        mock_pool = MagicMock()
+        mock_conn = MagicMock()
+        mock_pool.getconn.return_value = mock_conn
+
+        with patch("src.db.connection._pool", mock_pool):
+            with transaction():
+                for _ in range(3):
+                    with get_connection() as conn:
+                        commit(conn)
+                mock_conn.commit.assert_not_called()
+
+            mock_conn.commit.assert_called_once()
+            mock_pool.getconn.assert_called_once()
+            mock_pool.putconn.assert_called_once_with(mock_conn)
+
+    def test_transaction_rolls_back_on_exception(self):
+        """Should roll back and not commit when the block raises."""
+        from src.db.connection import commit, get_connection, transaction
+
+        mock_pool = MagicMock()
+        mock_conn = MagicMock()
+        mock_pool.getconn.return_value = mock_conn
+
+        with patch("src.db.connection._pool", mock_pool):
+            with pytest.raises(ValueError):
+                with transaction():
+                    raise ValueError("Test error")
+
+            mock_conn.commit.assert_not_called()
+            # Once on acquire, once for the failed block
+            assert mock_conn.rollback.call_count == 2
+
+            # Commits outside a transaction go straight through again
+            with get_connection() as conn:
+                commit(conn)
+            mock_conn.commit.assert_called_once()
+
+
+    def test_non_durable_transaction_relaxes_commit(self):
+        """durable=False should turn off synchronous_commit for that block only."""
+        from src.db.connection import ASYNC_COMMIT_SQL, transaction
+
+        mock_pool = MagicMock()
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.cursor.return_value.__enter__.return_value
+        mock_pool.getconn.return_value = mock_conn
+
+        with patch("src.db.connection._pool", mock_pool):
+            with transaction():
+                pass
+            mock_cursor.execute.assert_not_called()
+
+            with transaction(durable=False):
+                pass
+            mock_cursor.execute.assert_called_once_with(ASYNC_COMMIT_SQL)
+
+
 class TestConnectionCleanup:
     """Test connection pool cleanup."""
 
@@ -95,6 +95,21 @@ class TestFeedServiceGetUnifiedFeed:
         dates = [item.date for item in items]
         assert dates == sorted(dates, reverse=True)
 
+    def test_get_unified_feed_keeps_repository_order(
+        self, zotero_items: list[FeedItem], newsletter_items: list[FeedItem]
+    ) -> None:
+        """Test that already-ordered repository results are returned as-is."""
+        mock_repo = MagicMock()
+        ordered = [zotero_items[0], newsletter_items[0], zotero_items[1]]
+        mock_repo.get_feed_items.return_value = ordered
+
+        from src.services.feed import FeedService
+
+        service = FeedService(repository=mock_repo)
+        items = service.get_unified_feed()
+
+        assert items is ordered
+
     def test_get_unified_feed_respects_limit(
         self, zotero_items: list[FeedItem], newsletter_items: list[FeedItem]
     ) -> None:
@@ -254,20 +269,29 @@ class TestFeedServiceFilterItems:
 
     def test_filter_items_by_date_range(self, sample_items: list[FeedItem]) -> None:
         """Test filtering items by date range."""
+        start_date = datetime(2026, 1, 14, tzinfo=timezone.utc)
+        end_date = datetime(2026, 1, 16, tzinfo=timezone.utc)
         mock_repo = MagicMock()
-        mock_repo.get_feed_items.return_value = sample_items
+        mock_repo.get_feed_items.return_value = [
+            item for item in sample_items if start_date <= item.date <= end_date
+        ]
 
         from src.services.feed import FeedService
 
         service = FeedService(repository=mock_repo)
-        start_date = datetime(2026, 1, 14, tzinfo=timezone.utc)
-        end_date = datetime(2026, 1, 16, tzinfo=timezone.utc)
 
         items = service.filter_items(start_date=start_date, end_date=end_date)
 
-        # Should return items between Jan 14-16
-        for item in items:
-            assert start_date <= item.date <= end_date
+        # Date range and pagination are pushed down to the repository
+        mock_repo.get_feed_items.assert_called_once_with(
+            source_type=None,
+            limit=50,
+            offset=0,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        # Should return items between Jan 14-16, newest first
+        assert [item.id for item in items] == ["zotero:ABC123", "newsletter:MSG001"]
 
     def test_filter_items_no_matches(self) -> None:
         """Test filtering with no matching items."""
@@ -327,48 +351,39 @@ class TestFeedServiceSearchItems:
     def test_search_items_by_keyword_in_title(self, sample_items: list[FeedItem]) -> None:
         """Test searching items by keyword in title."""
         mock_repo = MagicMock()
-        mock_repo.get_feed_items.return_value = sample_items
+        mock_repo.search_feed_items.return_value = [sample_items[0], sample_items[2]]
 
         from src.services.feed import FeedService
 
         service = FeedService(repository=mock_repo)
         items = service.search_items(query="machine learning")
 
-        # Should find items with "machine learning" in title or summary
-        assert len(items) >= 1
+        # Matching is done by the repository query
+        mock_repo.search_feed_items.assert_called_once_with(
+            query="machine learning", source_type=None, limit=50, offset=0
+        )
         assert any("machine learning" in item.title.lower() for item in items)
 
-    def test_search_items_by_keyword_in_summary(self, sample_items: list[FeedItem]) -> None:
-        """Test searching items by keyword in summary."""
-        mock_repo = MagicMock()
-        mock_repo.get_feed_items.return_value = sample_items
-
-        from src.services.feed import FeedService
-
-        service = FeedService(repository=mock_repo)
-        items = service.search_items(query="neural networks")
-
-        # Should find the ML paper with "neural networks" in summary
-        assert len(items) >= 1
-        assert any("neural networks" in (item.summary or "").lower() for item in items)
-
-    def test_search_items_case_insensitive(self, sample_items: list[FeedItem]) -> None:
-        """Test that search is case insensitive."""
+    def test_search_items_sorted_by_date_descending(
+        self, sample_items: list[FeedItem]
+    ) -> None:
+        """Test search results are returned newest first."""
         mock_repo = MagicMock()
-        mock_repo.get_feed_items.return_value = sample_items
+        mock_repo.search_feed_items.return_value = list(reversed(sample_items))
 
         from src.services.feed import FeedService
 
         service = FeedService(repository=mock_repo)
-        items_lower = service.search_items(query="quantum")
-        items_upper = service.search_items(query="QUANTUM")
+        items = service.search_items(query="research")
 
-        assert len(items_lower) == len(items_upper)
+        assert [item.date for item in items] == sorted(
+            (item.date for item in sample_items), reverse=True
+        )
 
     def test_search_items_no_matches(self, sample_items: list[FeedItem]) -> None:
         """Test searching with no matching items."""
         mock_repo = MagicMock()
-        mock_repo.get_feed_items.return_value = sample_items
+        mock_repo.search_feed_items.return_value = []
 
         from src.services.feed import FeedService
 
@@ -3,6 +3,7 @@
 Tests NewsletterSource.fetch_items with mocked existing newsletter modules.
 """
 
+import threading
 from datetime import datetime, timezone
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -12,6 +13,14 @@ from src.models.feed_item import FeedItem
 from src.models.source import NewsletterConfig
 
 
+def _join_audio_threads() -> None:
+    """Wait for background audio generation started by fetch_items."""
+    from src.sources.newsletter import _AUDIO_POOL
+
+    # The pool has a single worker, so a no-op queued now runs after prior jobs
+    _AUDIO_POOL.submit(lambda: None).result()
+
+
 class TestNewsletterSource:
     """Tests for NewsletterSource adapter."""
 
@@ -76,8 +85,9 @@ class TestNewsletterSource:
                     fetched_at=datetime.now(timezone.utc),
                 ))
 
-            # Multiple calls: before pipeline, during pipeline steps, after pipeline
-            mock_repo.get_feed_items.side_effect = [[], feed_items, feed_items, feed_items]
+            # No items before the pipeline; feed_items once it has run
+            mock_repo.get_feed_item_ids.return_value = []
+            mock_repo.get_feed_items.return_value = feed_items
 
             yield {
                 "collect": mock_collect,
@@ -86,6 +96,8 @@ class TestNewsletterSource:
                 "audio": mock_audio,
                 "repo": mock_repo,
             }
+            # Let audio threads finish while the mocks are still patched in
+            _join_audio_threads()
 
     def test_fetch_items_returns_feed_items(
         self, newsletter_config: NewsletterConfig, mock_pipeline
@@ -165,6 +177,47 @@ class TestNewsletterSource:
         assert len(item_without_link) == 1
         assert item_without_link[0].link is None
 
+    def test_fetch_items_drops_exact_duplicates_before_llm(
+        self, newsletter_config: NewsletterConfig, mock_pipeline, monkeypatch
+    ) -> None:
+        """Test same-day items with the same title are removed locally."""
+        from src.sources.newsletter import NewsletterSource
+
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        mock_repo = mock_pipeline["repo"]
+        items = mock_repo.get_feed_items.return_value
+        repeat = items[0].model_copy(
+            update={"id": "newsletter:repeat", "title": "  ai news   ROUNDUP "}
+        )
+        mock_repo.get_feed_items.return_value = items + [repeat]
+
+        source = NewsletterSource(newsletter_config)
+        result = source.fetch_items()
+
+        mock_repo.delete_feed_items.assert_any_call(["newsletter:repeat"])
+        assert [item.id for item in result] == ["newsletter:0", "newsletter:1"]
+
+    def test_fetch_items_generates_audio_in_background(
+        self, newsletter_config: NewsletterConfig, mock_pipeline
+    ) -> None:
+        """Test fetch_items returns without waiting for audio generation."""
+        from src.sources.newsletter import NewsletterSource
+
+        release = threading.Event()
+        mock_audio = mock_pipeline["audio"]
+        mock_audio.side_effect = lambda items: release.wait(5) and {
+            "generated": len(items), "skipped": 0, "errors": []
+        }
+
+        source = NewsletterSource(newsletter_config)
+        items = source.fetch_items()
+
+        # Returned while audio generation is still blocked
+        assert len(items) == 2
+        release.set()
+        _join_audio_threads()
+        mock_audio.assert_called_once_with(items=items)
+
     def test_source_type_property(self, newsletter_config: NewsletterConfig) -> None:
         """Test that source_type property returns 'newsletter'."""
         from src.sources.newsletter import NewsletterSource
@@ -203,12 +256,14 @@ class TestNewsletterSource:
             # Mock Repository instance and methods
             mock_repo = MagicMock()
             mock_repo_class.return_value = mock_repo
-            mock_repo.get_feed_items.side_effect = [[], [feed_item_with_sender], [feed_item_with_sender], [feed_item_with_sender]]
+            mock_repo.get_feed_item_ids.return_value = []
+            mock_repo.get_feed_items.return_value = [feed_item_with_sender]
 
             from src.sources.newsletter import NewsletterSource
 
             source = NewsletterSource(newsletter_config)
             items = source.fetch_items()
+            _join_audio_threads()
 
             if items and "sender" in items[0].metadata:
                 assert items[0].metadata["sender"] == "newsletter@example.com"
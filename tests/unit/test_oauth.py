@@ -77,6 +77,20 @@ class TestTokenEncryption:
         # Encrypted values should be different
         assert encrypted1 != encrypted2
 
+    def test_key_derived_once_per_encryption_key(self) -> None:
+        """Test the PBKDF2 key derivation is not repeated for the same key."""
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+        from src.utils.crypto import _fernet_for_key, decrypt_token, encrypt_token
+
+        _fernet_for_key.cache_clear()
+        with patch.dict(os.environ, {"ENCRYPTION_KEY": "key1_32_bytes_padding_here_123!"}), \
+             patch("src.utils.crypto.PBKDF2HMAC", wraps=PBKDF2HMAC) as mock_kdf:
+            encrypted = encrypt_token({"access_token": "test"})
+            assert decrypt_token(encrypted) == {"access_token": "test"}
+
+        assert mock_kdf.call_count == 1
+        _fernet_for_key.cache_clear()
+
     def test_missing_encryption_key_raises_error(self) -> None:
         """Test that missing ENCRYPTION_KEY raises an error."""
         from src.utils.crypto import encrypt_token
@@ -45,7 +45,7 @@ class TestRepositoryFeedItems:
         mock_conn, mock_cursor = mock_db_connection
 
         # Mock database response
-        mock_cursor.fetchall.return_value = [
+        mock_cursor.__iter__.return_value = iter([
             (
                 "zotero:ABC123",
                 "zotero",
@@ -57,7 +57,7 @@ class TestRepositoryFeedItems:
                 {"authors": "Smith"},
                 datetime(2026, 1, 30, tzinfo=timezone.utc),
             )
-        ]
+        ])
 
         with patch("src.db.repository.get_connection", return_value=mock_conn):
             from src.db.repository import Repository
@@ -72,7 +72,7 @@ class TestRepositoryFeedItems:
     def test_get_feed_items_by_source(self, mock_db_connection) -> None:
         """Test filtering feed items by source type."""
         mock_conn, mock_cursor = mock_db_connection
-        mock_cursor.fetchall.return_value = []
+        mock_cursor.__iter__.return_value = iter([])
 
         with patch("src.db.repository.get_connection", return_value=mock_conn):
             from src.db.repository import Repository
@@ -97,10 +97,38 @@ class TestRepositoryFeedItems:
             mock_cursor.execute.assert_called()
             mock_conn.commit.assert_called()
 
+    def test_delete_feed_items_uses_one_statement(self, mock_db_connection) -> None:
+        """Test deleting several feed items issues a single DELETE."""
+        mock_conn, mock_cursor = mock_db_connection
+        mock_cursor.rowcount = 2
+
+        with patch("src.db.repository.get_connection", return_value=mock_conn):
+            from src.db.repository import Repository
+
+            repo = Repository()
+            deleted = repo.delete_feed_items(["newsletter:a", "newsletter:b"])
+
+            mock_cursor.execute.assert_called_once_with(
+                "DELETE FROM feed_items WHERE id = ANY(%s)",
+                (["newsletter:a", "newsletter:b"],),
+            )
+            mock_conn.commit.assert_called_once()
+            assert deleted == 2
+
+    def test_delete_feed_items_empty_list(self, mock_db_connection) -> None:
+        """Test deleting no items skips the database."""
+        mock_conn, mock_cursor = mock_db_connection
+
+        with patch("src.db.repository.get_connection", return_value=mock_conn):
+            from src.db.repository import Repository
+
+            assert Repository().delete_feed_items([]) == 0
+            mock_cursor.execute.assert_not_called()
+
     def test_get_feed_items_pagination(self, mock_db_connection) -> None:
         """Test feed items pagination with offset."""
         mock_conn, mock_cursor = mock_db_connection
-        mock_cursor.fetchall.return_value = []
+        mock_cursor.__iter__.return_value = iter([])
 
         with patch("src.db.repository.get_connection", return_value=mock_conn):
             from src.db.repository import Repository
@@ -112,6 +140,71 @@ class TestRepositoryFeedItems:
             assert "LIMIT" in str(call_args)
             assert "OFFSET" in str(call_args)
 
+    def test_get_feed_items_date_range(self, mock_db_connection) -> None:
+        """Test date range filters are applied in the query."""
+        mock_conn, mock_cursor = mock_db_connection
+        mock_cursor.__iter__.return_value = iter([])
+        start_date = datetime(2026, 1, 14, tzinfo=timezone.utc)
+        end_date = datetime(2026, 1, 16, tzinfo=timezone.utc)
+
+        with patch("src.db.repository.get_connection", return_value=mock_conn):
+            from src.db.repository import Repository
+
+            repo = Repository()
+            repo.get_feed_items(start_date=start_date, end_date=end_date)
+
+            query, params = mock_cursor.execute.call_args[0]
+            assert "item_date >= %s" in query
+            assert "item_date <= %s" in query
+            assert params[:2] == [start_date, end_date]
+
+    def test_search_feed_items_escapes_wildcards(self, mock_db_connection) -> None:
+        """Test search is a case-insensitive substring match with literal wildcards."""
+        mock_conn, mock_cursor = mock_db_connection
+        mock_cursor.__iter__.return_value = iter([])
+
+        with patch("src.db.repository.get_connection", return_value=mock_conn):
+            from src.db.repository import Repository
+
+            repo = Repository()
+            repo.search_feed_items("100%_AI", source_type="newsletter")
+
+            query, params = mock_cursor.execute.call_args[0]
+            assert "ILIKE" in query
+            assert params[:3] == ["%100\\%\\_AI%", "%100\\%\\_AI%", "newsletter"]
+
+    def test_count_feed_items(self, mock_db_connection) -> None:
+        """Test counting items uses COUNT(*) rather than fetching rows."""
+        mock_conn, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = (42,)
+
+        with patch("src.db.repository.get_connection", return_value=mock_conn):
+            from src.db.repository import Repository
+
+            repo = Repository()
+            count = repo.count_feed_items(source_type="zotero", days=7)
+
+            query, params = mock_cursor.execute.call_args[0]
+            assert count == 42
+            assert "COUNT(*)" in query
+            assert params == ["zotero", 7]
+
+    def test_get_feed_item_ids(self, mock_db_connection) -> None:
+        """Test fetching IDs selects only the id column."""
+        mock_conn, mock_cursor = mock_db_connection
+        mock_cursor.__iter__.return_value = iter([("newsletter:a",), ("newsletter:b",)])
+
+        with patch("src.db.repository.get_connection", return_value=mock_conn):
+            from src.db.repository import Repository
+
+            repo = Repository()
+            ids = repo.get_feed_item_ids(source_type="newsletter", limit=10)
+
+            query, params = mock_cursor.execute.call_args[0]
+            assert ids == ["newsletter:a", "newsletter:b"]
+            assert query.startswith("SELECT id FROM feed_items")
+            assert params == ["newsletter", 10]
+
 
 class TestRepositorySourceConfig:
     """Tests for SourceConfig CRUD operations."""
@@ -195,7 +288,8 @@ class TestRepositoryBulkOperations:
         """Test saving multiple feed items in a batch."""
         mock_conn, mock_cursor = mock_db_connection
 
-        with patch("src.db.repository.get_connection", return_value=mock_conn):
+        with patch("src.db.repository.get_connection", return_value=mock_conn), \
+             patch("src.db.repository.execute_values") as mock_execute_values:
             from src.db.repository import Repository
 
             repo = Repository()
@@ -214,7 +308,12 @@ class TestRepositoryBulkOperations:
             repo.save_feed_items(items)
 
             # Should use batch insert
+            mock_execute_values.assert_called_once()
+            rows = mock_execute_values.call_args[0][2]
+            assert [row[0] for row in rows] == ["zotero:ITEM0", "zotero:ITEM1", "zotero:ITEM2"]
             mock_conn.commit.assert_called()
+            # Durability is left to the caller's transaction()
+            mock_cursor.execute.assert_not_called()
 
     def test_delete_old_feed_items(self, mock_db_connection) -> None:
         """Test deleting old feed items for retention."""
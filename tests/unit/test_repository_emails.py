@@ -54,11 +54,11 @@ class TestGetProcessedMessageIds:
         repo = Repository()
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [
+        mock_cursor.__iter__.return_value = iter([
             ("msg1",),
             ("msg2",),
             ("msg3",)
-        ]
+        ])
         mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
 
         with patch("src.db.repository.get_connection") as mock_get_conn:
@@ -73,10 +73,10 @@ class TestGetProcessedMessageIds:
         repo = Repository()
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [
+        mock_cursor.__iter__.return_value = iter([
             ("msg1",),
             ("msg2",)
-        ]
+        ])
         mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
 
         with patch("src.db.repository.get_connection") as mock_get_conn:
@@ -90,12 +90,29 @@ class TestGetProcessedMessageIds:
         execute_args = mock_cursor.execute.call_args[0]
         assert "sender_email IN" in execute_args[0] or "sender_email = ANY" in execute_args[0]
 
+    def test_filters_by_status(self):
+        """Should filter by processing status when provided."""
+        repo = Repository()
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__iter__.return_value = iter([("msg1",)])
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with patch("src.db.repository.get_connection") as mock_get_conn:
+            mock_get_conn.return_value.__enter__.return_value = mock_conn
+            result = repo.get_processed_message_ids(status="parsed")
+
+        assert result == {"msg1"}
+        query, params = mock_cursor.execute.call_args[0]
+        assert "status = %s" in query
+        assert params == ("parsed",)
+
     def test_returns_empty_set_when_no_results(self):
         """Should return empty set when no emails processed."""
         repo = Repository()
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = []
+        mock_cursor.__iter__.return_value = iter([])
         mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
 
         with patch("src.db.repository.get_connection") as mock_get_conn:
@@ -84,6 +84,24 @@ class TestRetryUtility:
         result = test_function()
         assert result == "success"
 
+    def test_with_retry_adds_jitter_to_backoff(self) -> None:
+        """Test that exponential waits stay within base wait plus jitter."""
+        from src.services.retry import with_retry
+
+        @with_retry(max_attempts=3, wait_seconds=0.01, exponential=True)
+        def always_fails():
+            raise ConnectionError("Network error")
+
+        with patch("tenacity.nap.time.sleep") as mock_sleep:
+            with pytest.raises(ConnectionError):
+                always_fails()
+
+        waits = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(waits) == 2
+        # Exponential part is 0.01 then 0.02; jitter adds up to 0.01
+        assert 0.01 <= waits[0] <= 0.02
+        assert 0.02 <= waits[1] <= 0.03
+
     def test_with_retry_logs_retries(self) -> None:
         """Test that retries are logged."""
         from src.services.retry import with_retry
@@ -105,6 +123,90 @@ class TestRetryUtility:
             # Note: This depends on implementation details
 
 
+class TestRetryOnRateLimit:
+    """Tests for retry_on_rate_limit decorator."""
+
+    def test_retries_rate_limit_errors(self) -> None:
+        """Test that 429 errors are retried."""
+        from src.services.retry import retry_on_rate_limit
+
+        call_count = 0
+
+        @retry_on_rate_limit(max_attempts=3, base_wait=0.01)
+        def rate_limited_function():
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise Exception("429 RESOURCE_EXHAUSTED")
+            return "success"
+
+        assert rate_limited_function() == "success"
+        assert call_count == 2
+
+    def test_retries_transient_status_codes(self) -> None:
+        """Test that exceptions carrying a 5xx status are retried."""
+        from src.services.retry import retry_on_rate_limit
+
+        class ApiError(Exception):
+            def __init__(self, status_code: int) -> None:
+                super().__init__(f"HTTP {status_code}")
+                self.status_code = status_code
+
+        call_count = 0
+
+        @retry_on_rate_limit(max_attempts=3, base_wait=0.01)
+        def flaky_function():
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise ApiError(503)
+            return "success"
+
+        assert flaky_function() == "success"
+        assert call_count == 2
+
+    def test_does_not_retry_non_retryable_errors(self) -> None:
+        """Test that validation and auth errors fail on the first attempt."""
+        from src.services.retry import retry_on_rate_limit
+
+        class ApiError(Exception):
+            status_code = 401
+
+        call_count = 0
+
+        @retry_on_rate_limit(max_attempts=5, base_wait=0.01)
+        def failing_function(error: Exception):
+            nonlocal call_count
+            call_count += 1
+            raise error
+
+        with pytest.raises(ValueError):
+            failing_function(ValueError("bad input"))
+        with pytest.raises(ApiError):
+            failing_function(ApiError("unauthorised"))
+        # Digits 429 inside an ID or count are not a rate limit
+        with pytest.raises(RuntimeError):
+            failing_function(RuntimeError("prompt of 14290 tokens is invalid"))
+        assert call_count == 3
+
+    def test_retries_httpx_network_errors(self) -> None:
+        """Test that httpx transport errors and timeouts are retried."""
+        import httpx
+
+        from src.services.retry import retry_on_rate_limit
+
+        errors = [httpx.ConnectError("refused"), httpx.ReadTimeout("slow")]
+
+        @retry_on_rate_limit(max_attempts=3, base_wait=0.01)
+        def flaky_function():
+            if errors:
+                raise errors.pop(0)
+            return "success"
+
+        assert flaky_function() == "success"
+        assert errors == []
+
+
 class TestRefreshAll:
     """Tests for FeedService.refresh_all method."""
 
@@ -223,3 +325,37 @@ class TestRefreshAll:
         service.refresh_all()
 
         mock_repo.save_feed_items_batch.assert_called_once_with(items)
+
+
+    def test_refresh_all_fetches_sources_concurrently(self) -> None:
+        """Test that a slow source does not hold up the others."""
+        import threading
+        from unittest.mock import MagicMock
+
+        from src.services.feed import FeedService
+
+        newsletter_started = threading.Event()
+
+        # Zotero only returns once the newsletter fetch is under way, which
+        # can only happen if both run at the same time
+        mock_zotero = MagicMock()
+        mock_zotero.source_type = "zotero"
+        mock_zotero.fetch_items.side_effect = (
+            lambda: [] if newsletter_started.wait(timeout=5) else None
+        )
+
+        mock_newsletter = MagicMock()
+        mock_newsletter.source_type = "newsletter"
+        mock_newsletter.fetch_items.side_effect = (
+            lambda: newsletter_started.set() or []
+        )
+
+        service = FeedService(repository=MagicMock())
+        service.register_source(mock_zotero)
+        service.register_source(mock_newsletter)
+
+        result = service.refresh_all()
+
+        assert result["success"] is True
+        assert list(result["sources"]) == ["zotero", "newsletter"]
+        assert result["sources"]["zotero"]["error"] is None
@@ -11,6 +11,33 @@ import pytest
 from src.models.feed_item import FeedItem
 
 
+class TestSourceRegistry:
+    """Tests for SourceRegistry.register."""
+
+    def test_register_reads_class_attribute(self) -> None:
+        """Test that register uses the source_type class attribute."""
+        from src.sources import SourceRegistry
+
+        class MySource:
+            source_type = "my_source"
+
+        registry = SourceRegistry()
+        assert registry.register(MySource) is MySource
+        assert registry.get("my_source") is MySource
+
+    def test_register_rejects_missing_source_type(self) -> None:
+        """Test that a source without a class attribute is rejected."""
+        from src.sources import SourceRegistry
+
+        class MySource:
+            @property
+            def source_type(self) -> str:
+                return "my_source"
+
+        with pytest.raises(TypeError, match="source_type"):
+            SourceRegistry().register(MySource)
+
+
 class TestFeedSourceProtocol:
     """Tests for FeedSource protocol compliance."""
 